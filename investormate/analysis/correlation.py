@@ -3,9 +3,10 @@ Multi-stock correlation analysis for InvestorMate.
 Helps identify diversification opportunities and correlated stock pairs.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple, Optional
+import numpy as np
 import pandas as pd
-import yfinance as yf
 
 from ..data.constants import get_ticker_format
 from ..utils.exceptions import DataFetchError
@@ -51,6 +52,8 @@ class Correlation:
         self.interval = validate_interval(interval)
         self._returns = None
         self._prices = None
+        self._ranks = None
+        self._matrix_cache = {}
     
     def _fetch_price_data(self) -> pd.DataFrame:
         """
@@ -64,26 +67,36 @@ class Correlation:
         """
         if self._prices is not None:
             return self._prices
-        
+
+        # Imported here rather than at module level so that
+        # `import investormate` does not pay the yfinance import cost
+        import yfinance as yf
+
+        def _fetch_one(ticker: str):
+            formatted_ticker = get_ticker_format(ticker)
+            yf_ticker = yf.Ticker(formatted_ticker)
+            return yf_ticker.history(period=self.period, interval=self.interval)
+
+        # Each history call is an HTTP round-trip, so N tickers fetched
+        # through a thread pool cost roughly one round-trip of wall clock
         price_data = {}
         failed_tickers = []
-        
-        for ticker in self.tickers:
-            try:
-                formatted_ticker = get_ticker_format(ticker)
-                yf_ticker = yf.Ticker(formatted_ticker)
-                hist = yf_ticker.history(period=self.period, interval=self.interval)
-                
-                if hist.empty:
+
+        with ThreadPoolExecutor(max_workers=min(16, len(self.tickers))) as executor:
+            futures = {ticker: executor.submit(_fetch_one, ticker)
+                       for ticker in self.tickers}
+            for ticker, future in futures.items():
+                try:
+                    hist = future.result()
+                    if hist.empty:
+                        failed_tickers.append(ticker)
+                        continue
+                    # Use Close price for correlation analysis
+                    price_data[ticker] = hist['Close']
+                except Exception:
                     failed_tickers.append(ticker)
                     continue
-                
-                # Use Close price for correlation analysis
-                price_data[ticker] = hist['Close']
-            except Exception as e:
-                failed_tickers.append(ticker)
-                continue
-        
+
         if not price_data:
             raise DataFetchError(
                 f"Failed to fetch data for all tickers. Failed: {', '.join(failed_tickers)}"
@@ -114,10 +127,15 @@ class Correlation:
             return self._returns
         
         prices = self._fetch_price_data()
-        
-        # Calculate percentage change (daily returns)
-        self._returns = prices.pct_change().dropna()
-        
+
+        # Prices are already dense (rows with NaNs were dropped), so daily
+        # returns reduce to one np.diff pass over the array instead of
+        # pct_change's alignment and NaN machinery
+        arr = prices.to_numpy(dtype=np.float64)
+        returns = np.diff(arr, axis=0) / arr[:-1]
+        self._returns = pd.DataFrame(returns, index=prices.index[1:],
+                                     columns=prices.columns)
+
         if self._returns.empty:
             raise DataFetchError("Not enough data to calculate returns")
         
@@ -142,9 +160,39 @@ class Correlation:
         valid_methods = ['pearson', 'spearman', 'kendall']
         if method not in valid_methods:
             raise ValueError(f"Method must be one of {valid_methods}")
-        
+
+        # matrix() backs find_pairs, diversification search, and statistics;
+        # each method's result is computed once per instance
+        cached = self._matrix_cache.get(method)
+        if cached is not None:
+            return cached
+
         returns = self._get_returns()
-        return returns.corr(method=method)
+        if method == 'kendall':
+            # Tau keeps pandas' implementation; it has no matmul form
+            matrix = returns.corr(method=method)
+        else:
+            if method == 'spearman':
+                # Spearman is Pearson on ranks: rank-transform the returns
+                # once (average ranks, matching pandas' tie handling) and
+                # reuse the matmul path below. The ranks are cached so
+                # repeated spearman calls skip the transform too
+                if self._ranks is None:
+                    self._ranks = returns.rank(axis=0).to_numpy(dtype=np.float64)
+                arr = self._ranks
+            else:
+                arr = returns.to_numpy(dtype=np.float64)
+
+            # Center and normalize once, then let one BLAS matrix product
+            # produce all pairwise coefficients
+            centered = arr - arr.mean(axis=0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                normed = centered / centered.std(axis=0, ddof=1)
+                corr = normed.T @ normed / (arr.shape[0] - 1)
+            matrix = pd.DataFrame(corr, index=returns.columns, columns=returns.columns)
+
+        self._matrix_cache[method] = matrix
+        return matrix
     
     def find_pairs(self, threshold: float = 0.7, method: str = 'pearson') -> List[Tuple[str, str, float]]:
         """
@@ -165,23 +213,23 @@ class Correlation:
             raise ValueError("Threshold must be between 0 and 1")
         
         corr_matrix = self.matrix(method=method)
-        pairs = []
-        
-        # Iterate through upper triangle of correlation matrix (avoid duplicates)
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i + 1, len(corr_matrix.columns)):
-                ticker1 = corr_matrix.columns[i]
-                ticker2 = corr_matrix.columns[j]
-                correlation = corr_matrix.iloc[i, j]
-                
-                # Check if correlation meets threshold
-                if abs(correlation) >= threshold:
-                    pairs.append((ticker1, ticker2, round(correlation, 4)))
-        
-        # Sort by absolute correlation value (descending)
-        pairs.sort(key=lambda x: abs(x[2]), reverse=True)
-        
-        return pairs
+        columns = corr_matrix.columns
+
+        # Pull the upper triangle (each pair once) and filter/sort it with
+        # vectorized operations instead of a Python double loop
+        values = corr_matrix.to_numpy()
+        row_idx, col_idx = np.triu_indices(values.shape[0], k=1)
+        pair_values = values[row_idx, col_idx]
+
+        mask = np.abs(pair_values) >= threshold
+        row_idx, col_idx, pair_values = row_idx[mask], col_idx[mask], pair_values[mask]
+
+        # Sort by absolute correlation value (descending); stable to keep
+        # the original pair order on ties, matching the old list sort
+        order = np.argsort(-np.abs(pair_values), kind='stable')
+
+        return [(columns[i], columns[j], round(float(v), 4))
+                for i, j, v in zip(row_idx[order], col_idx[order], pair_values[order])]
     
     def find_diversification_candidates(
         self,
@@ -235,26 +283,27 @@ class Correlation:
             raise ValueError(f"Universe tickers not in correlation data: {missing_universe}")
         
         corr_matrix = self.matrix(method=method)
-        candidates = []
-        
-        for candidate in universe:
-            # Don't recommend stocks already in portfolio
-            if candidate in portfolio:
-                continue
-            
-            # Calculate average correlation with portfolio stocks
-            correlations = [corr_matrix.loc[candidate, portfolio_stock] 
-                          for portfolio_stock in portfolio]
-            avg_correlation = sum(correlations) / len(correlations)
-            
-            # Only include if below threshold
-            if abs(avg_correlation) <= max_correlation:
-                candidates.append((candidate, round(avg_correlation, 4)))
-        
-        # Sort by absolute correlation (lowest first = best diversification)
-        candidates.sort(key=lambda x: abs(x[1]))
-        
-        return candidates
+
+        # Don't recommend stocks already in portfolio
+        portfolio_set = set(portfolio)
+        eligible = [t for t in universe if t not in portfolio_set]
+        if not eligible:
+            return []
+
+        # One matrix slice and one row-wise reduction replace the
+        # candidate-by-candidate label lookups
+        sub = corr_matrix.loc[eligible, portfolio].to_numpy()
+        avg = sub.mean(axis=1)
+        abs_avg = np.abs(avg)
+
+        # Only include if below threshold, sorted by absolute correlation
+        # (lowest first = best diversification); stable sort keeps the
+        # universe order on ties like the old list sort did
+        mask = abs_avg <= max_correlation
+        kept = np.flatnonzero(mask)
+        order = kept[np.argsort(abs_avg[kept], kind='stable')]
+
+        return [(eligible[i], round(float(avg[i]), 4)) for i in order]
     
     def get_statistics(self) -> Dict:
         """
@@ -271,29 +320,28 @@ class Correlation:
         """
         prices = self._fetch_price_data()
         corr_matrix = self.matrix()
-        
-        # Calculate average correlation (excluding diagonal)
-        correlations = []
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i + 1, len(corr_matrix.columns)):
-                correlations.append(corr_matrix.iloc[i, j])
-        
-        avg_corr = sum(correlations) / len(correlations) if correlations else 0
-        max_corr = max(correlations) if correlations else 0
-        min_corr = min(correlations) if correlations else 0
-        
-        # Find tickers for max and min correlation
+        columns = corr_matrix.columns
+
+        # One pass over the upper triangle (each pair once, diagonal
+        # excluded) gives the average plus the extreme pairs, replacing
+        # the nested iloc loops
+        values = corr_matrix.to_numpy()
+        row_idx, col_idx = np.triu_indices(values.shape[0], k=1)
+        pair_values = values[row_idx, col_idx]
+
+        avg_corr = 0
         max_pair = None
         min_pair = None
-        
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i + 1, len(corr_matrix.columns)):
-                corr = corr_matrix.iloc[i, j]
-                if corr == max_corr:
-                    max_pair = (corr_matrix.columns[i], corr_matrix.columns[j], round(corr, 4))
-                if corr == min_corr:
-                    min_pair = (corr_matrix.columns[i], corr_matrix.columns[j], round(corr, 4))
-        
+
+        if pair_values.size:
+            avg_corr = float(pair_values.mean())
+            kmax = int(pair_values.argmax())
+            kmin = int(pair_values.argmin())
+            max_pair = (columns[row_idx[kmax]], columns[col_idx[kmax]],
+                        round(float(pair_values[kmax]), 4))
+            min_pair = (columns[row_idx[kmin]], columns[col_idx[kmin]],
+                        round(float(pair_values[kmin]), 4))
+
         return {
             'ticker_count': len(prices.columns),
             'tickers': list(prices.columns),
@@ -3,8 +3,11 @@ Valuation module for InvestorMate.
 DCF (Discounted Cash Flow), comparable companies, and fair value summary.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 
+import numpy as np
+
 from ..utils.helpers import safe_divide
 from ..data.fetchers import get_yfinance_data
 from ..data.constants import get_ticker_format
@@ -49,6 +52,10 @@ class Valuation:
         self._balance_sheet = balance_sheet or {}
         self._income_stmt = income_stmt or {}
         self._cash_flow = cash_flow or {}
+        # DCF results per assumption set; the inputs (info, ratios) are
+        # fixed for the life of the instance, so identical assumptions
+        # always produce identical results
+        self._dcf_cache = {}
 
     def _get_fcf(self) -> Optional[float]:
         """Get trailing free cash flow (FCF). Prefer info['freeCashflow'], else derive."""
@@ -97,6 +104,11 @@ class Valuation:
             Dict with keys: fair_value_per_share, enterprise_value, dcf_value,
             terminal_value_pv, fcf_series, wacc_used, assumptions.
         """
+        cache_key = (growth_rate, terminal_growth, terminal_multiple, years, wacc)
+        cached = self._dcf_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         fcf0 = self._get_fcf()
         shares = self._get_shares()
         wacc_used = wacc
@@ -121,18 +133,20 @@ class Valuation:
         }
 
         if fcf0 is None or fcf0 <= 0 or shares is None or shares <= 0:
+            self._dcf_cache[cache_key] = result
             return result
 
-        # Project FCF
-        fcf_series = []
+        # Project FCF into a preallocated float64 array: contiguous storage
+        # instead of a list of boxed floats, and len()/indexing work the same
+        fcf_series = np.empty(years, dtype=np.float64)
         fcf = fcf0
         pv_fcf = 0.0
         for i in range(1, years + 1):
-            fcf_series.append(round(fcf, 2))
+            fcf_series[i - 1] = round(fcf, 2)
             pv_fcf += fcf / ((1 + wacc_used) ** i)
             fcf = fcf * (1 + growth_rate)
 
-        fcf_last = fcf_series[-1]
+        fcf_last = float(fcf_series[-1])
         if terminal_multiple is not None and terminal_multiple > 0:
             terminal_value = terminal_multiple * fcf_last
         else:
@@ -151,6 +165,7 @@ class Valuation:
         result["enterprise_value"] = round(enterprise_value, 2)
         result["fair_value_per_share"] = round(fair_value_per_share, 2)
         result["fcf_series"] = fcf_series
+        self._dcf_cache[cache_key] = result
         return result
 
     def comps(
@@ -196,22 +211,32 @@ class Valuation:
             except Exception:
                 return {}
 
+        # Each lookup is an independent I/O round trip, so fetch the stock
+        # and its peers concurrently; get_yfinance_data is TTL-cached
+        # upstream, so repeat calls (e.g. comps inside summary) are free
         all_tickers = [self.ticker] + list(peers)
-        peer_multiples = {}
-        for t in all_tickers:
-            peer_multiples[t] = get_peer_data(t)
-
-        pes = [peer_multiples[t]["pe"] for t in peer_multiples if peer_multiples[t].get("pe") is not None]
-        ev_ebitdas = [
-            peer_multiples[t]["ev_ebitda"]
-            for t in peer_multiples
-            if peer_multiples[t].get("ev_ebitda") is not None
-        ]
-        pss = [peer_multiples[t]["ps"] for t in peer_multiples if peer_multiples[t].get("ps") is not None]
-
-        median_pe = float(sorted(pes)[len(pes) // 2]) if pes else None
-        median_ev_ebitda = float(sorted(ev_ebitdas)[len(ev_ebitdas) // 2]) if ev_ebitdas else None
-        median_ps = float(sorted(pss)[len(pss) // 2]) if pss else None
+        with ThreadPoolExecutor(max_workers=min(8, len(all_tickers))) as executor:
+            peer_multiples = dict(zip(all_tickers, executor.map(get_peer_data, all_tickers)))
+
+        # One (n_tickers, 3) array with NaN for missing values lets a single
+        # nanmedian pass produce all three medians in compiled code instead
+        # of three Python-level sorts
+        metric_keys = ("pe", "ev_ebitda", "ps")
+        multiples = np.array(
+            [
+                [m[k] if m.get(k) is not None else np.nan for k in metric_keys]
+                for m in peer_multiples.values()
+            ],
+            dtype=np.float64,
+        )
+        has_data = ~np.isnan(multiples).all(axis=0)
+        col_medians = np.full(len(metric_keys), np.nan)
+        if has_data.any():
+            col_medians[has_data] = np.nanmedian(multiples[:, has_data], axis=0)
+
+        median_pe = float(col_medians[0]) if has_data[0] else None
+        median_ev_ebitda = float(col_medians[1]) if has_data[1] else None
+        median_ps = float(col_medians[2]) if has_data[2] else None
 
         # Implied value = multiple * metric (for this stock)
         ttm_eps = self._info.get("trailingEps")
@@ -343,24 +368,52 @@ class Valuation:
         growth_rates = growth_rates or [0.03, 0.05, 0.07]
         wacc_rates = wacc_rates or [0.08, 0.10, 0.12]
 
-        table = {}
-        all_values = []
-        for g in growth_rates:
-            table[g] = {}
-            for w in wacc_rates:
-                dcf = self.dcf(growth_rate=g, wacc=w, years=years, terminal_growth=terminal_growth)
-                fv = dcf.get("fair_value_per_share")
-                table[g][w] = fv
-                if fv is not None:
-                    all_values.append(fv)
-
         current = self._info.get("currentPrice")
         if current is not None:
             current = float(current)
 
+        fcf0 = self._get_fcf()
+        shares = self._get_shares()
+        if fcf0 is None or fcf0 <= 0 or shares is None or shares <= 0:
+            return {
+                "table": {g: {w: None for w in wacc_rates} for g in growth_rates},
+                "current_price": current,
+                "min_value": None,
+                "max_value": None,
+            }
+
+        # The whole grid in one broadcast instead of one dcf() call per
+        # cell: growth down axis 0, WACC across axis 1, years along the
+        # last axis. Arithmetic mirrors dcf() exactly, including its
+        # rounding of the final-year FCF before the terminal value
+        g = np.asarray(growth_rates, dtype=np.float64)[:, None, None]
+        w = np.asarray(wacc_rates, dtype=np.float64)[None, :, None]
+        t = np.arange(1, years + 1, dtype=np.float64)[None, None, :]
+
+        cash = fcf0 * (1.0 + g) ** (t - 1.0)
+        pv_fcf = (cash / (1.0 + w) ** t).sum(axis=-1)
+
+        fcf_last = np.round(fcf0 * (1.0 + g[:, :, 0]) ** (years - 1), 2)
+        denom = w[:, :, 0] - terminal_growth
+        with np.errstate(divide='ignore', invalid='ignore'):
+            terminal_value = np.where(
+                denom > 0, fcf_last * (1.0 + terminal_growth) / denom, 0.0
+            )
+        terminal_value_pv = terminal_value / (1.0 + w[:, :, 0]) ** years
+
+        fair_values = np.round((pv_fcf + terminal_value_pv) / shares, 2)
+
+        table = {
+            growth: {
+                wacc: float(fair_values[i, j])
+                for j, wacc in enumerate(wacc_rates)
+            }
+            for i, growth in enumerate(growth_rates)
+        }
+
         return {
             "table": table,
             "current_price": current,
-            "min_value": min(all_values) if all_values else None,
-            "max_value": max(all_values) if all_values else None,
+            "min_value": float(fair_values.min()),
+            "max_value": float(fair_values.max()),
         }
@@ -0,0 +1,49 @@
+"""
+Optional Numba-accelerated kernels for backtest metrics.
+
+When numba is installed (pip install investormate[speed]) the risk metrics
+run as a fused, JIT-compiled single pass over the returns buffer; without
+it, callers fall back to the vectorized NumPy path.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised only without the extra
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def drawdown_stats(returns):
+        """
+        Compute (max_drawdown_fraction, mean, sample_std) in one sweep.
+
+        Tracks the running peak of the cumulative curve plus the sum and
+        sum of squares of returns, so max drawdown, mean, and std all fall
+        out of a single pass with no temporaries.
+        """
+        n = returns.shape[0]
+        cumulative = 1.0
+        peak = 1.0
+        max_dd = 0.0
+        total = 0.0
+        total_sq = 0.0
+        for i in range(n):
+            r = returns[i]
+            cumulative *= 1.0 + r
+            if cumulative > peak:
+                peak = cumulative
+            dd = (cumulative - peak) / peak
+            if dd < max_dd:
+                max_dd = dd
+            total += r
+            total_sq += r * r
+        mean = total / n
+        variance = (total_sq - n * mean * mean) / (n - 1)
+        if variance < 0.0:
+            variance = 0.0
+        return max_dd, mean, np.sqrt(variance)
+else:
+    drawdown_stats = None
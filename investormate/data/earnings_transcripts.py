@@ -3,10 +3,11 @@ Earnings Call Transcripts module for InvestorMate.
 Fetches and processes earnings call transcripts.
 """
 
+import sys
 from typing import Dict, List, Optional
 import pandas as pd
-import yfinance as yf
 from ..utils.exceptions import DataFetchError
+from .fetchers import _ticker as _shared_ticker
 
 
 class EarningsCallTranscripts:
@@ -18,7 +19,11 @@ class EarningsCallTranscripts:
         >>> transcript_list = transcripts.get_transcripts_list()
         >>> q4_2024 = transcripts.get_transcript(2024, 4)
     """
-    
+
+    # No per-instance __dict__: callers building one handler per ticker
+    # across a large universe shouldn't pay dict overhead per instance
+    __slots__ = ('ticker', '_ticker_obj', '_transcripts_cache', '_transcripts_list_cache')
+
     def __init__(self, ticker: str):
         """
         Initialize earnings call transcripts handler.
@@ -29,12 +34,15 @@ class EarningsCallTranscripts:
         self.ticker = ticker
         self._ticker_obj = None
         self._transcripts_cache = {}
-    
+        self._transcripts_list_cache: Optional[pd.DataFrame] = None
+
     @property
     def _yf_ticker(self):
-        """Get yfinance Ticker object (cached)."""
+        """Get yfinance Ticker object (cached, shared across instances)."""
         if self._ticker_obj is None:
-            self._ticker_obj = yf.Ticker(self.ticker)
+            # Module-level LRU cache so two instances for the same ticker
+            # share one Ticker and its internal yfinance HTTP cache
+            self._ticker_obj = _shared_ticker(self.ticker)
         return self._ticker_obj
     
     def get_transcripts_list(self) -> pd.DataFrame:
@@ -50,34 +58,33 @@ class EarningsCallTranscripts:
             For actual transcripts, integration with services like AlphaSense,
             Seeking Alpha, or SEC Edgar would be required.
         """
+        if self._transcripts_list_cache is not None:
+            return self._transcripts_list_cache
         try:
-            # Get earnings dates as a proxy for available transcripts
+            # Get earnings dates as a proxy for available transcripts;
+            # only the index is needed, so drop the DataFrame right away
             earnings_dates = self._yf_ticker.earnings_dates
-            
+
             if earnings_dates is None or earnings_dates.empty:
                 return pd.DataFrame(columns=['fiscal_year', 'fiscal_quarter', 'report_date', 'has_transcript'])
-            
-            # Convert earnings dates to transcript list format
-            result = []
-            for date, row in earnings_dates.iterrows():
-                # Extract year and quarter from date
-                year = date.year
-                quarter = (date.month - 1) // 3 + 1
-                
-                result.append({
-                    'fiscal_year': year,
-                    'fiscal_quarter': quarter,
-                    'report_date': date.strftime('%Y-%m-%d'),
-                    'has_transcript': False  # yfinance doesn't provide transcripts
-                })
-            
-            df = pd.DataFrame(result)
+
+            dates = earnings_dates.index
+            del earnings_dates
+
+            # Build the transcript list columns vectorized on the DatetimeIndex
+            df = pd.DataFrame({
+                'fiscal_year': dates.year.astype('int64'),
+                'fiscal_quarter': ((dates.month - 1) // 3 + 1).astype('int64'),
+                'report_date': dates.strftime('%Y-%m-%d'),
+                'has_transcript': False  # yfinance doesn't provide transcripts
+            })
             # Remove duplicates and sort
             df = df.drop_duplicates(subset=['fiscal_year', 'fiscal_quarter'])
             df = df.sort_values(['fiscal_year', 'fiscal_quarter'], ascending=False)
-            
-            return df.reset_index(drop=True)
-            
+
+            self._transcripts_list_cache = df.reset_index(drop=True)
+            return self._transcripts_list_cache
+
         except Exception as e:
             raise DataFetchError(f"Failed to fetch transcripts list: {str(e)}")
     
@@ -132,19 +139,14 @@ class EarningsCallTranscripts:
             print("  - AlphaSense (commercial service)")
             return
         
-        # Format and print transcript
-        print(f"\n{'='*80}")
-        print(f"Earnings Call Transcript - {self.ticker} FY{year} Q{quarter}")
-        print(f"{'='*80}\n")
-        
-        for _, row in transcript.iterrows():
-            speaker = row['speaker']
-            content = row['content']
-            
-            print(f"\n[{speaker}]")
-            print("-" * 80)
-            print(content)
-            print()
+        # Format the transcript into one buffer and write it in a single call
+        # instead of several locked print() calls per paragraph
+        lines = [f"\n{'=' * 80}\n"
+                 f"Earnings Call Transcript - {self.ticker} FY{year} Q{quarter}\n"
+                 f"{'=' * 80}\n"]
+        for speaker, content in transcript[['speaker', 'content']].itertuples(index=False, name=None):
+            lines.append(f"\n\n[{speaker}]\n{'-' * 80}\n{content}\n")
+        sys.stdout.write(''.join(lines) + '\n')
     
     def search_transcript(self, year: int, quarter: int, keyword: str) -> List[Dict]:
         """
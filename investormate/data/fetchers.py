@@ -3,13 +3,194 @@ Data fetching utilities for InvestorMate.
 Wrappers around yfinance for JSON-serializable stock data.
 """
 
-from typing import Dict, Optional
+import re
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from functools import lru_cache, wraps
+from typing import Dict, List, Optional
 import pandas as pd
-import yfinance as yf
+import requests
+from requests.adapters import HTTPAdapter, Retry
 
+from .cache import cached_json
 from .constants import get_ticker_format, get_ticker_country
+from .parsers import normalize_dict
 
 
+@lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    """
+    Get the shared HTTP session used by all fetchers.
+
+    A single pooled session keeps TCP+TLS connections to Yahoo alive across
+    calls, so only the first request per host pays the handshake cost.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def _yf():
+    """
+    Import yfinance on first use.
+
+    Importing yfinance eagerly adds a few hundred milliseconds to
+    `import investormate` even for callers that never fetch data, so the
+    import is deferred until the first fetcher actually runs.
+    """
+    import yfinance
+    return yfinance
+
+
+@lru_cache(maxsize=256)
+def _ticker(ticker_name: str):
+    """
+    Get a yf.Ticker for a symbol, reusing one instance per process.
+
+    yfinance Ticker objects memoize fetched endpoints internally, so sharing
+    one instance across fetcher calls avoids duplicate HTTP round-trips when
+    a caller requests several statements for the same ticker.
+    """
+    return _yf().Ticker(get_ticker_format(ticker_name), session=_session())
+
+
+_CRYPTO_SUMMARY_URL = "https://query1.finance.yahoo.com/v7/finance/quote?"
+
+_CRYPTO_SUMMARY_FIELDS = [
+    "shortName", "regularMarketPrice", "regularMarketChange",
+    "regularMarketChangePercent", "currency", "fromCurrency", "toCurrency",
+    "exchangeTimezoneName", "exchangeTimezoneShortName", "gmtOffSetMilliseconds",
+    "regularMarketTime", "preMarketTime", "postMarketTime",
+    "extendedMarketTime", "overnightMarketTime"
+]
+
+_CRYPTO_SUMMARY_SYMBOLS = ["BNB-USD", "BTC-USD", "DOGE-USD", "ETH-USD", "SOL-USD",
+                           "USDC-USD", "USDT-USD", "XRP-USD"]
+
+# Pre-joined once: the batched quote request takes all symbols/fields as
+# comma-separated strings and they never change between calls
+_CRYPTO_SUMMARY_PARAMS = {
+    "fields": ",".join(_CRYPTO_SUMMARY_FIELDS),
+    "formatted": False,
+    "lang": "en-US",
+    "market": "CRYPTOCURRENCIES",
+    "symbols": ",".join(_CRYPTO_SUMMARY_SYMBOLS)
+}
+
+
+# Cheap plausibility check so obviously invalid symbols never cost a
+# network round-trip
+_TICKER_VALID_RE = re.compile(r'^[A-Za-z0-9.\-^&]{1,16}$')
+
+# Negative cache: (endpoint, ticker) pairs that came back empty twice in a
+# row are assumed dead for the rest of the process, avoiding repeat 404/429
+# round-trips. Keyed per endpoint because an empty result is often
+# legitimate for one endpoint (ETFs have no balance sheet, small caps have
+# no analyst estimates) and must not poison the others.
+_EMPTY_TICKERS = set()
+_empty_streaks = {}
+_streak_lock = threading.Lock()
+
+
+def _negative_cache(empty_factory):
+    """
+    Decorator that short-circuits fetchers for invalid or known-empty tickers.
+
+    Args:
+        empty_factory: Callable producing the fetcher's empty result
+                       (dict, list, or lambda: None)
+
+    Returns:
+        Decorator tracking empty-response streaks per (endpoint, ticker).
+    """
+    def decorator(func):
+        endpoint = func.__name__
+
+        @wraps(func)
+        def wrapper(ticker_name, *args, **kwargs):
+            key = (endpoint, ticker_name)
+            if key in _EMPTY_TICKERS or not _TICKER_VALID_RE.match(ticker_name):
+                return empty_factory()
+            result = func(ticker_name, *args, **kwargs)
+            # fetch_all runs these wrappers from worker threads, so streak
+            # bookkeeping goes through a lock
+            with _streak_lock:
+                if not result:
+                    streak = _empty_streaks.get(key, 0) + 1
+                    _empty_streaks[key] = streak
+                    if streak >= 2:
+                        _EMPTY_TICKERS.add(key)
+                else:
+                    _empty_streaks.pop(key, None)
+            return result
+        return wrapper
+    return decorator
+
+
+def _format_key(key) -> str:
+    """Convert a DataFrame index/column label to a string key."""
+    if isinstance(key, pd.Timestamp):
+        return key.strftime('%Y-%m-%d')
+    return str(key)
+
+
+def _df_to_nested_dict(df: pd.DataFrame, orient: str = "columns") -> Dict:
+    """
+    Convert a DataFrame to a nested JSON-serializable dictionary.
+
+    NaN values are masked to None in a single vectorized pass instead of
+    per-cell pd.notnull checks inside iterrows() loops.
+
+    Args:
+        df: DataFrame to convert
+        orient: "columns" for {column: {row: value}} (financial statements),
+                "rows" for {row: {column: value}} (estimates/history)
+
+    Returns:
+        Nested dictionary with string keys and float/None values
+    """
+    values = df.astype(object).where(df.notnull(), None)
+    if orient == "columns":
+        # Stringify the whole column index at once: statements have a
+        # DatetimeIndex, so strftime runs vectorized instead of per-label
+        if isinstance(df.columns, pd.DatetimeIndex):
+            col_keys = df.columns.strftime('%Y-%m-%d')
+        else:
+            col_keys = [_format_key(col) for col in df.columns]
+        values.columns = col_keys
+        values.index = values.index.astype(str)
+        return values.to_dict()
+    # Row orientation: keys are already strings after astype, and numpy
+    # floats subclass Python float, so pandas can build the dict in C
+    values.index = values.index.astype(str)
+    values.columns = values.columns.astype(str)
+    return values.to_dict(orient='index')
+
+
+def _estimate_records(ticker_name: str, attr: str) -> Optional[Dict]:
+    """
+    Fetch a row-oriented estimate/history DataFrame attribute as a dict.
+
+    Args:
+        ticker_name: Stock ticker symbol
+        attr: yf.Ticker attribute name (e.g. 'earnings_estimate')
+
+    Returns:
+        Row-oriented nested dictionary, or None when yfinance has no data
+    """
+    df = getattr(_ticker(ticker_name), attr)
+    if df is not None:
+        return _df_to_nested_dict(df, orient="rows")
+    return None
+
+
+@cached_json(ttl_days=1 / 24, namespace='info')
+@_negative_cache(dict)
 def get_yfinance_data(ticker_name: str) -> Dict:
     """
     Get basic stock information.
@@ -20,18 +201,23 @@ def get_yfinance_data(ticker_name: str) -> Dict:
     Returns:
         Dictionary with stock info (JSON-serializable). Empty dict if no data.
     """
-    ticker = yf.Ticker(get_ticker_format(ticker_name))
+    ticker = _ticker(ticker_name)
     info = ticker.info
     if info is None or not isinstance(info, dict):
         return {}
-    # Convert any Timestamp objects to strings
+    # Most info dicts carry no Timestamps at all; one scan finds the few
+    # keys that do, so the common case skips rebuilding hundreds of entries
+    ts_keys = [key for key, value in info.items() if isinstance(value, pd.Timestamp)]
+    if not ts_keys:
+        return info
     result = dict(info)
-    for key, value in result.items():
-        if isinstance(value, pd.Timestamp):
-            result[key] = value.strftime('%Y-%m-%d %H:%M:%S')
+    for key in ts_keys:
+        result[key] = result[key].strftime('%Y-%m-%d %H:%M:%S')
     return result
 
 
+@cached_json(ttl_days=1, namespace='balance_sheet')
+@_negative_cache(dict)
 def get_yfinance_balance_sheet_data(ticker_name: str) -> Dict:
     """
     Get balance sheet data.
@@ -42,24 +228,15 @@ def get_yfinance_balance_sheet_data(ticker_name: str) -> Dict:
     Returns:
         Dictionary with balance sheet data (JSON-serializable). Empty dict if no data.
     """
-    ticker = yf.Ticker(get_ticker_format(ticker_name))
+    ticker = _ticker(ticker_name)
     df = ticker.balance_sheet
     if df is None or (isinstance(df, pd.DataFrame) and df.empty):
         return {}
-    # Create a new dictionary with string keys
-    result = {}
-    for col in df.columns:
-        # Convert column name to string if it's a datetime
-        if isinstance(col, pd.Timestamp):
-            col_str = col.strftime('%Y-%m-%d')
-        else:
-            col_str = str(col)
-        # Convert each row's index to string and store values
-        result[col_str] = {str(idx): float(val) if pd.notnull(val) else None 
-                          for idx, val in df[col].items()}
-    return result
+    return _df_to_nested_dict(df, orient="columns")
 
 
+@cached_json(ttl_days=1, namespace='income_statement')
+@_negative_cache(dict)
 def get_yfinance_income_statement_data(ticker_name: str) -> Dict:
     """
     Get income statement data.
@@ -70,24 +247,15 @@ def get_yfinance_income_statement_data(ticker_name: str) -> Dict:
     Returns:
         Dictionary with income statement data (JSON-serializable). Empty dict if no data.
     """
-    ticker = yf.Ticker(get_ticker_format(ticker_name))
+    ticker = _ticker(ticker_name)
     df = ticker.incomestmt
     if df is None or (isinstance(df, pd.DataFrame) and df.empty):
         return {}
-    # Create a new dictionary with string keys
-    result = {}
-    for col in df.columns:
-        # Convert column name to string if it's a datetime
-        if isinstance(col, pd.Timestamp):
-            col_str = col.strftime('%Y-%m-%d')
-        else:
-            col_str = str(col)
-        # Convert each row's index to string and store values
-        result[col_str] = {str(idx): float(val) if pd.notnull(val) else None 
-                          for idx, val in df[col].items()}
-    return result
+    return _df_to_nested_dict(df, orient="columns")
 
 
+@cached_json(ttl_days=1, namespace='cash_flow')
+@_negative_cache(dict)
 def get_yfinance_cash_flow_statement_data(ticker_name: str) -> Dict:
     """
     Get cash flow statement data.
@@ -98,24 +266,101 @@ def get_yfinance_cash_flow_statement_data(ticker_name: str) -> Dict:
     Returns:
         Dictionary with cash flow data (JSON-serializable). Empty dict if no data.
     """
-    ticker = yf.Ticker(get_ticker_format(ticker_name))
+    ticker = _ticker(ticker_name)
     df = ticker.cash_flow
     if df is None or (isinstance(df, pd.DataFrame) and df.empty):
         return {}
-    # Create a new dictionary with string keys
-    result = {}
-    for col in df.columns:
-        # Convert column name to string if it's a datetime
-        if isinstance(col, pd.Timestamp):
-            col_str = col.strftime('%Y-%m-%d')
+    return _df_to_nested_dict(df, orient="columns")
+
+
+def _statement_json(ticker_name: str, attr: str) -> str:
+    """
+    Serialize a statement DataFrame attribute straight to a JSON string.
+
+    Goes through pandas' C JSON writer, skipping the intermediate Python
+    dict entirely for callers whose destination is JSON anyway.
+
+    Args:
+        ticker_name: Stock ticker symbol
+        attr: yf.Ticker attribute name (e.g. 'balance_sheet')
+
+    Returns:
+        JSON string keyed by ISO date columns. "{}" when no data.
+    """
+    df = getattr(_ticker(ticker_name), attr)
+    if df is None or (isinstance(df, pd.DataFrame) and df.empty):
+        return "{}"
+    return df.to_json(orient='columns', date_format='iso')
+
+
+def get_yfinance_balance_sheet_json(ticker_name: str) -> str:
+    """
+    Get balance sheet data as a JSON string.
+
+    Args:
+        ticker_name: Stock ticker symbol
+
+    Returns:
+        JSON string with balance sheet data. "{}" if no data.
+    """
+    return _statement_json(ticker_name, 'balance_sheet')
+
+
+def get_yfinance_income_statement_json(ticker_name: str) -> str:
+    """
+    Get income statement data as a JSON string.
+
+    Args:
+        ticker_name: Stock ticker symbol
+
+    Returns:
+        JSON string with income statement data. "{}" if no data.
+    """
+    return _statement_json(ticker_name, 'incomestmt')
+
+
+def get_yfinance_cash_flow_statement_json(ticker_name: str) -> str:
+    """
+    Get cash flow statement data as a JSON string.
+
+    Args:
+        ticker_name: Stock ticker symbol
+
+    Returns:
+        JSON string with cash flow data. "{}" if no data.
+    """
+    return _statement_json(ticker_name, 'cash_flow')
+
+
+def get_yfinance_financials_bundle(ticker_name: str) -> Dict[str, Dict]:
+    """
+    Get balance sheet, income statement, and cash flow in one Ticker lifetime.
+
+    Reusing a single Ticker lets yfinance amortize its internal financials
+    fetch across all three statements instead of paying the HTTP cost per
+    statement.
+
+    Args:
+        ticker_name: Stock ticker symbol
+
+    Returns:
+        Dictionary with 'balance_sheet', 'income_statement' and 'cash_flow'
+        keys, each a JSON-serializable dict (empty when no data)
+    """
+    ticker = _ticker(ticker_name)
+    bundle = {}
+    for key, df in (('balance_sheet', ticker.balance_sheet),
+                    ('income_statement', ticker.incomestmt),
+                    ('cash_flow', ticker.cash_flow)):
+        if df is None or (isinstance(df, pd.DataFrame) and df.empty):
+            bundle[key] = {}
         else:
-            col_str = str(col)
-        # Convert each row's index to string and store values
-        result[col_str] = {str(idx): float(val) if pd.notnull(val) else None 
-                          for idx, val in df[col].items()}
-    return result
+            bundle[key] = _df_to_nested_dict(df, orient="columns")
+    return bundle
 
 
+@cached_json(ttl_days=1, namespace='earnings_estimate')
+@_negative_cache(lambda: None)
 def get_yfinance_earnings_estimate(ticker_name: str) -> Optional[Dict]:
     """
     Get earnings estimates.
@@ -126,16 +371,11 @@ def get_yfinance_earnings_estimate(ticker_name: str) -> Optional[Dict]:
     Returns:
         Dictionary with earnings estimates or None
     """
-    ticker = yf.Ticker(get_ticker_format(ticker_name))
-    df = ticker.earnings_estimate
-    if df is not None:
-        # Convert DataFrame to dictionary with row indices as keys
-        return {str(idx): {str(col): float(val) if pd.notnull(val) else None 
-                          for col, val in row.items()}
-                for idx, row in df.iterrows()}
-    return None
+    return _estimate_records(ticker_name, 'earnings_estimate')
 
 
+@cached_json(ttl_days=1, namespace='earnings_history')
+@_negative_cache(lambda: None)
 def get_yfinance_earnings_history(ticker_name: str) -> Optional[Dict]:
     """
     Get earnings history.
@@ -146,16 +386,11 @@ def get_yfinance_earnings_history(ticker_name: str) -> Optional[Dict]:
     Returns:
         Dictionary with earnings history or None
     """
-    ticker = yf.Ticker(get_ticker_format(ticker_name))
-    df = ticker.earnings_history
-    if df is not None:
-        # Convert DataFrame to dictionary with row indices as keys
-        return {str(idx): {str(col): float(val) if pd.notnull(val) else None 
-                          for col, val in row.items()}
-                for idx, row in df.iterrows()}
-    return None
+    return _estimate_records(ticker_name, 'earnings_history')
 
 
+@cached_json(ttl_days=1, namespace='revenue_estimate')
+@_negative_cache(lambda: None)
 def get_yfinance_revenue_estimate(ticker_name: str) -> Optional[Dict]:
     """
     Get revenue estimates.
@@ -166,16 +401,11 @@ def get_yfinance_revenue_estimate(ticker_name: str) -> Optional[Dict]:
     Returns:
         Dictionary with revenue estimates or None
     """
-    ticker = yf.Ticker(get_ticker_format(ticker_name))
-    df = ticker.revenue_estimate
-    if df is not None:
-        # Convert DataFrame to dictionary with row indices as keys
-        return {str(idx): {str(col): float(val) if pd.notnull(val) else None 
-                          for col, val in row.items()}
-                for idx, row in df.iterrows()}
-    return None
+    return _estimate_records(ticker_name, 'revenue_estimate')
 
 
+@cached_json(ttl_days=1, namespace='eps_trend')
+@_negative_cache(lambda: None)
 def get_yfinance_eps_trend(ticker_name: str) -> Optional[Dict]:
     """
     Get EPS trend data.
@@ -186,16 +416,11 @@ def get_yfinance_eps_trend(ticker_name: str) -> Optional[Dict]:
     Returns:
         Dictionary with EPS trend or None
     """
-    ticker = yf.Ticker(get_ticker_format(ticker_name))
-    df = ticker.eps_trend
-    if df is not None:
-        # Convert DataFrame to dictionary with row indices as keys
-        return {str(idx): {str(col): float(val) if pd.notnull(val) else None 
-                          for col, val in row.items()}
-                for idx, row in df.iterrows()}
-    return None
+    return _estimate_records(ticker_name, 'eps_trend')
 
 
+@cached_json(ttl_days=1, namespace='eps_revisions')
+@_negative_cache(lambda: None)
 def get_yfinance_eps_revisions(ticker_name: str) -> Optional[Dict]:
     """
     Get EPS revisions.
@@ -206,16 +431,11 @@ def get_yfinance_eps_revisions(ticker_name: str) -> Optional[Dict]:
     Returns:
         Dictionary with EPS revisions or None
     """
-    ticker = yf.Ticker(get_ticker_format(ticker_name))
-    df = ticker.eps_revisions
-    if df is not None:
-        # Convert DataFrame to dictionary with row indices as keys
-        return {str(idx): {str(col): float(val) if pd.notnull(val) else None 
-                          for col, val in row.items()}
-                for idx, row in df.iterrows()}
-    return None
+    return _estimate_records(ticker_name, 'eps_revisions')
 
 
+@cached_json(ttl_days=1, namespace='growth_estimates')
+@_negative_cache(lambda: None)
 def get_yfinance_growth_estimates(ticker_name: str) -> Optional[Dict]:
     """
     Get growth estimates.
@@ -226,16 +446,11 @@ def get_yfinance_growth_estimates(ticker_name: str) -> Optional[Dict]:
     Returns:
         Dictionary with growth estimates or None
     """
-    ticker = yf.Ticker(get_ticker_format(ticker_name))
-    df = ticker.growth_estimates
-    if df is not None:
-        # Convert DataFrame to dictionary with row indices as keys
-        return {str(idx): {str(col): float(val) if pd.notnull(val) else None 
-                          for col, val in row.items()}
-                for idx, row in df.iterrows()}
-    return None
+    return _estimate_records(ticker_name, 'growth_estimates')
 
 
+@cached_json(ttl_days=1, namespace='history')
+@_negative_cache(dict)
 def get_yfinance_stock_history(ticker_name: str, period: str = "1y", interval: str = "1d") -> Dict:
     """
     Get historical stock price data (OHLCV).
@@ -248,7 +463,7 @@ def get_yfinance_stock_history(ticker_name: str, period: str = "1y", interval: s
     Returns:
         Dictionary with historical OHLCV data. Empty dict if no data.
     """
-    ticker = yf.Ticker(get_ticker_format(ticker_name))
+    ticker = _ticker(ticker_name)
     df = ticker.history(period=period, interval=interval)
     
     if df is None or (isinstance(df, pd.DataFrame) and df.empty):
@@ -262,23 +477,156 @@ def get_yfinance_stock_history(ticker_name: str, period: str = "1y", interval: s
     if missing_columns:
         return {}
 
-    # Extract only the required columns
-    df_selected = df[required_columns]
-
-    # Convert the data to a dictionary format with dates as keys
-    result = {}
-    for idx, row in df_selected.iterrows():
-        date_str = str(idx)
-        result[date_str] = {
-            'Open': float(row['Open']) if pd.notnull(row['Open']) else None,
-            'High': float(row['High']) if pd.notnull(row['High']) else None,
-            'Low': float(row['Low']) if pd.notnull(row['Low']) else None,
-            'Close': float(row['Close']) if pd.notnull(row['Close']) else None,
-            'Volume': float(row['Volume']) if pd.notnull(row['Volume']) else None
-        }
-    return result
+    # Extract only the required columns as floats with dates as string keys
+    df_selected = df[required_columns].astype('float64')
+    df_selected.index = df_selected.index.astype(str)
+
+    # Mask NaN to None once, then let pandas build the nested dict in C
+    # instead of materializing a Series per row via iterrows()
+    df_selected = df_selected.astype(object).where(df_selected.notnull(), None)
+    return df_selected.to_dict(orient='index')
+
+
+def _fetch_many(fetch_func, ticker_names: List[str], threads: int = 10, **kwargs) -> Dict[str, Dict]:
+    """
+    Fan a single-ticker fetcher out over many tickers concurrently.
+
+    Each call is network-bound, so a small thread pool collapses wall-clock
+    time from the sum of latencies to roughly the max latency.
+
+    Args:
+        fetch_func: Single-ticker fetcher to call per symbol
+        ticker_names: Ticker symbols to fetch
+        threads: Maximum number of concurrent workers
+
+    Returns:
+        Dictionary mapping each ticker to its fetch result
+    """
+    if not ticker_names:
+        return {}
+    max_workers = min(threads, len(ticker_names))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda name: fetch_func(name, **kwargs), ticker_names)
+        return dict(zip(ticker_names, results))
 
 
+def get_yfinance_data_many(ticker_names: List[str], threads: int = 10) -> Dict[str, Dict]:
+    """
+    Get basic stock information for multiple tickers concurrently.
+
+    Args:
+        ticker_names: Stock ticker symbols
+        threads: Maximum number of concurrent workers
+
+    Returns:
+        Dictionary mapping each ticker to its info dictionary
+    """
+    return _fetch_many(get_yfinance_data, ticker_names, threads)
+
+
+def get_yfinance_data_batch(ticker_names: List[str], group_size: int = 20,
+                            threads: int = 5) -> Dict[str, Dict]:
+    """
+    Get basic stock information for many tickers via batched yf.Tickers calls.
+
+    Yahoo accepts about 20 symbols per quote URL, so grouping collapses a
+    100-ticker scan from 100 HTTP round-trips to 5, and the groups
+    themselves are fetched concurrently.
+
+    Args:
+        ticker_names: Stock ticker symbols
+        group_size: Symbols per yf.Tickers batch (Yahoo caps around 20)
+        threads: Maximum number of groups fetched concurrently
+
+    Returns:
+        Dictionary mapping each input ticker to its info dictionary
+        (empty dict when no data)
+    """
+    if not ticker_names:
+        return {}
+    formatted = {name: get_ticker_format(name) for name in ticker_names}
+    symbols = list(formatted.values())
+    groups = [symbols[i:i + group_size] for i in range(0, len(symbols), group_size)]
+
+    def _fetch_group(group: List[str]) -> Dict[str, Dict]:
+        multi = _yf().Tickers(" ".join(group), session=_session())
+        out = {}
+        for sym in group:
+            # yf.Tickers uppercases its dict keys, so index with the
+            # uppercased symbol to keep lowercase input working
+            info = multi.tickers[sym.upper()].info
+            out[sym] = normalize_dict(info) if info else {}
+        return out
+
+    by_symbol = {}
+    with ThreadPoolExecutor(max_workers=min(threads, len(groups))) as executor:
+        for group_result in executor.map(_fetch_group, groups):
+            by_symbol.update(group_result)
+    return {name: by_symbol.get(sym, {}) for name, sym in formatted.items()}
+
+
+def get_yfinance_balance_sheet_data_many(ticker_names: List[str], threads: int = 10) -> Dict[str, Dict]:
+    """
+    Get balance sheet data for multiple tickers concurrently.
+
+    Args:
+        ticker_names: Stock ticker symbols
+        threads: Maximum number of concurrent workers
+
+    Returns:
+        Dictionary mapping each ticker to its balance sheet dictionary
+    """
+    return _fetch_many(get_yfinance_balance_sheet_data, ticker_names, threads)
+
+
+def get_yfinance_income_statement_data_many(ticker_names: List[str], threads: int = 10) -> Dict[str, Dict]:
+    """
+    Get income statement data for multiple tickers concurrently.
+
+    Args:
+        ticker_names: Stock ticker symbols
+        threads: Maximum number of concurrent workers
+
+    Returns:
+        Dictionary mapping each ticker to its income statement dictionary
+    """
+    return _fetch_many(get_yfinance_income_statement_data, ticker_names, threads)
+
+
+def get_yfinance_cash_flow_statement_data_many(ticker_names: List[str], threads: int = 10) -> Dict[str, Dict]:
+    """
+    Get cash flow statement data for multiple tickers concurrently.
+
+    Args:
+        ticker_names: Stock ticker symbols
+        threads: Maximum number of concurrent workers
+
+    Returns:
+        Dictionary mapping each ticker to its cash flow dictionary
+    """
+    return _fetch_many(get_yfinance_cash_flow_statement_data, ticker_names, threads)
+
+
+def get_yfinance_stock_history_many(ticker_names: List[str], period: str = "1y",
+                                    interval: str = "1d", threads: int = 10) -> Dict[str, Dict]:
+    """
+    Get historical OHLCV data for multiple tickers concurrently.
+
+    Args:
+        ticker_names: Stock ticker symbols
+        period: Time period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+        interval: Data interval (1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo)
+        threads: Maximum number of concurrent workers
+
+    Returns:
+        Dictionary mapping each ticker to its OHLCV dictionary
+    """
+    return _fetch_many(get_yfinance_stock_history, ticker_names, threads,
+                       period=period, interval=interval)
+
+
+@cached_json(ttl_days=1 / 24, namespace='news')
+@_negative_cache(list)
 def get_yfinance_ticker_news(ticker_name: str) -> list:
     """
     Get latest news for a stock.
@@ -289,11 +637,13 @@ def get_yfinance_ticker_news(ticker_name: str) -> list:
     Returns:
         List of news items. Empty list if no data.
     """
-    ticker = yf.Ticker(get_ticker_format(ticker_name))
+    ticker = _ticker(ticker_name)
     news = ticker.news
     return list(news) if news else []
 
 
+@cached_json(ttl_days=1, namespace='filings')
+@_negative_cache(list)
 def get_yfinance_ticker_filings(ticker_name: str) -> list:
     """
     Get SEC filings for a stock (US stocks only).
@@ -305,7 +655,7 @@ def get_yfinance_ticker_filings(ticker_name: str) -> list:
         List of SEC filings or empty list for non-US stocks
     """
     if get_ticker_country(ticker_name) == "US":
-        ticker = yf.Ticker(get_ticker_format(ticker_name))
+        ticker = _ticker(ticker_name)
         filings = getattr(ticker, 'sec_filings', None)
         return list(filings) if filings else []
     else:
@@ -320,24 +670,8 @@ def get_yfinance_market_summary_crypto() -> Dict:
     Returns:
         Dictionary with crypto market data
     """
-    summary_url = "https://query1.finance.yahoo.com/v7/finance/quote?"
-    summary_fields = [
-        "shortName", "regularMarketPrice", "regularMarketChange", 
-        "regularMarketChangePercent", "currency", "fromCurrency", "toCurrency",
-        "exchangeTimezoneName", "exchangeTimezoneShortName", "gmtOffSetMilliseconds",
-        "regularMarketTime", "preMarketTime", "postMarketTime", 
-        "extendedMarketTime", "overnightMarketTime"
-    ]
-    symbols = ["BNB-USD", "BTC-USD", "DOGE-USD", "ETH-USD", "SOL-USD", "USDC-USD", "USDT-USD", "XRP-USD"]
-    summary_params = {
-        "fields": ",".join(summary_fields),
-        "formatted": False,
-        "lang": "en-US",
-        "market": "CRYPTOCURRENCIES",
-        "symbols": ",".join(symbols)
-    }
-    
-    summary = yf.Market("CRYPTOCURRENCIES")._fetch_json(summary_url, summary_params)
+    summary = _yf().Market("CRYPTOCURRENCIES", session=_session())._fetch_json(
+        _CRYPTO_SUMMARY_URL, _CRYPTO_SUMMARY_PARAMS)
     return summary if summary is not None else {}
 
 
@@ -348,7 +682,7 @@ def get_yfinance_market_summary_us() -> Dict:
     Returns:
         Dictionary with US market data. Empty dict if no data.
     """
-    markets = yf.Market("US")
+    markets = _yf().Market("US", session=_session())
     summary = getattr(markets, 'summary', None)
     return summary if summary is not None else {}
 
@@ -360,7 +694,7 @@ def get_yfinance_market_summary_asia() -> Dict:
     Returns:
         Dictionary with Asian market data. Empty dict if no data.
     """
-    markets = yf.Market("ASIA")
+    markets = _yf().Market("ASIA", session=_session())
     summary = getattr(markets, 'summary', None)
     return summary if summary is not None else {}
 
@@ -372,7 +706,7 @@ def get_yfinance_market_summary_europe() -> Dict:
     Returns:
         Dictionary with European market data. Empty dict if no data.
     """
-    markets = yf.Market("EUROPE")
+    markets = _yf().Market("EUROPE", session=_session())
     summary = getattr(markets, 'summary', None)
     return summary if summary is not None else {}
 
@@ -384,7 +718,7 @@ def get_yfinance_market_summary_currency() -> Dict:
     Returns:
         Dictionary with currency market data. Empty dict if no data.
     """
-    markets = yf.Market("CURRENCIES")
+    markets = _yf().Market("CURRENCIES", session=_session())
     summary = getattr(markets, 'summary', None)
     return summary if summary is not None else {}
 
@@ -396,6 +730,104 @@ def get_yfinance_market_summary_commodities() -> Dict:
     Returns:
         Dictionary with commodities market data. Empty dict if no data.
     """
-    markets = yf.Market("COMMODITIES")
+    markets = _yf().Market("COMMODITIES", session=_session())
     summary = getattr(markets, 'summary', None)
     return summary if summary is not None else {}
+
+
+# Per-ticker endpoints that fetch_all can request concurrently
+_ENDPOINTS = {
+    "info": get_yfinance_data,
+    "balance_sheet": get_yfinance_balance_sheet_data,
+    "income_statement": get_yfinance_income_statement_data,
+    "cash_flow": get_yfinance_cash_flow_statement_data,
+    "earnings_estimate": get_yfinance_earnings_estimate,
+    "earnings_history": get_yfinance_earnings_history,
+    "revenue_estimate": get_yfinance_revenue_estimate,
+    "eps_trend": get_yfinance_eps_trend,
+    "eps_revisions": get_yfinance_eps_revisions,
+    "growth_estimates": get_yfinance_growth_estimates,
+    "history": get_yfinance_stock_history,
+    "news": get_yfinance_ticker_news,
+    "filings": get_yfinance_ticker_filings,
+}
+
+
+def fetch_all(ticker_name: str, endpoints: Optional[List[str]] = None,
+              max_workers: int = 12, timeout: float = 30) -> Dict[str, object]:
+    """
+    Fetch several yfinance endpoints for one ticker concurrently.
+
+    A dashboard typically needs 8-10 endpoints back-to-back; each is an
+    independent network call, so submitting them to a thread pool costs
+    roughly one round-trip of wall-clock instead of the sum.
+
+    Args:
+        ticker_name: Stock ticker symbol
+        endpoints: Endpoint names from _ENDPOINTS to fetch (all by default)
+        max_workers: Maximum number of concurrent workers
+        timeout: Overall deadline in seconds for all endpoints together
+
+    Returns:
+        Dictionary mapping endpoint name to its result. Endpoints that fail
+        or miss the deadline are reported via warnings.warn and returned
+        as None.
+    """
+    names = list(_ENDPOINTS) if endpoints is None else list(endpoints)
+    unknown = [name for name in names if name not in _ENDPOINTS]
+    if unknown:
+        raise ValueError(f"Unknown endpoints: {unknown}. Valid: {list(_ENDPOINTS)}")
+
+    results = {}
+    # No context manager: its implicit shutdown(wait=True) would block on a
+    # hung endpoint until it finished, defeating the deadline. Shutdown is
+    # managed explicitly so a timeout abandons stragglers instead.
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(names)))
+    futures = {executor.submit(_ENDPOINTS[name], ticker_name): name for name in names}
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as exc:
+                warnings.warn(f"fetch_all: endpoint '{name}' failed for "
+                              f"{ticker_name}: {exc}")
+                results[name] = None
+    except FuturesTimeoutError:
+        for name in futures.values():
+            if name not in results:
+                warnings.warn(f"fetch_all: endpoint '{name}' timed out for "
+                              f"{ticker_name}")
+                results[name] = None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def get_all_market_summaries(threads: int = 6) -> Dict[str, Dict]:
+    """
+    Get all market summaries (crypto, US, Asia, Europe, currency, commodities)
+    concurrently.
+
+    Each summary is an independent network call, so running them in a thread
+    pool collapses wall-clock time from the sum of latencies to roughly the
+    slowest single call.
+
+    Args:
+        threads: Maximum number of concurrent workers
+
+    Returns:
+        Dictionary mapping market name to its summary dictionary
+    """
+    fetchers = {
+        "crypto": get_yfinance_market_summary_crypto,
+        "us": get_yfinance_market_summary_us,
+        "asia": get_yfinance_market_summary_asia,
+        "europe": get_yfinance_market_summary_europe,
+        "currency": get_yfinance_market_summary_currency,
+        "commodities": get_yfinance_market_summary_commodities,
+    }
+    max_workers = min(threads, len(fetchers))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda func: func(), fetchers.values())
+        return dict(zip(fetchers.keys(), results))
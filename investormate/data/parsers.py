@@ -7,55 +7,117 @@ from typing import Any, Dict, Optional
 import pandas as pd
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+import json as _json
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback serializer for numpy scalars, arrays, and timestamps."""
+    try:
+        return value.item()
+    except AttributeError:
+        return str(value)
+    except ValueError:
+        # .item() rejects arrays with more than one element; match
+        # orjson's OPT_SERIALIZE_NUMPY by emitting them as lists
+        return value.tolist()
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Uses orjson when installed (3-5x faster, serializes numpy natively via
+    OPT_SERIALIZE_NUMPY), falling back to the stdlib otherwise.
+
+    Args:
+        obj: JSON-serializable object (numpy scalars/arrays supported)
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return _json.dumps(obj, default=_json_default)
+
+
+def loads(data) -> Any:
+    """
+    Deserialize a JSON string or bytes.
+
+    Args:
+        data: JSON string or bytes
+
+    Returns:
+        Deserialized Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return _json.loads(data)
+
+
+def _normalize_timestamp(value) -> str:
+    """Format a Timestamp/datetime for JSON output."""
+    return value.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _normalize_float(value: float) -> Optional[float]:
+    """Map NaN and infinities to None; pass other floats through."""
+    # value != value is the scalar NaN check; far cheaper than pd.isna
+    if value != value or value == float('inf') or value == float('-inf'):
+        return None
+    return value
+
 
 def normalize_value(value: Any) -> Optional[Any]:
     """
     Normalize a single value to be JSON-serializable.
-    
+
     Args:
         value: Any value from yfinance
-        
+
     Returns:
         JSON-serializable value or None
     """
-    if value is None or (isinstance(value, float) and pd.isna(value)):
-        return None
-    
-    if isinstance(value, pd.Timestamp):
-        return value.strftime('%Y-%m-%d %H:%M:%S')
-    
+    # Constant-time handler lookup on the exact type instead of a chain of
+    # isinstance checks; unknown types fall through to str()
+    handler = _DISPATCH.get(type(value))
+    if handler is not None:
+        return handler(value)
+    # Subclasses (numpy floats, OrderedDict, ...) miss the exact-type table
+    # and take the slower isinstance path the table replaced
     if isinstance(value, datetime):
-        return value.strftime('%Y-%m-%d %H:%M:%S')
-    
-    if isinstance(value, (int, float, str, bool)):
-        # Handle NaN and infinity
-        if isinstance(value, float):
-            if pd.isna(value):
-                return None
-            if value == float('inf') or value == float('-inf'):
-                return None
+        return _normalize_timestamp(value)
+    if isinstance(value, float):
+        return _normalize_float(value)
+    if isinstance(value, (int, str)):
         return value
-    
     if isinstance(value, dict):
         return normalize_dict(value)
-    
     if isinstance(value, list):
         return [normalize_value(item) for item in value]
-    
-    # Convert other types to string
     return str(value)
 
 
 def normalize_dict(data: Dict) -> Dict:
     """
     Normalize a dictionary to be JSON-serializable.
-    
+
     Args:
         data: Dictionary with potentially non-serializable values
-        
+
     Returns:
         JSON-serializable dictionary
     """
+    # Already-clean dicts (string keys, plain scalar values) are the common
+    # case; one scan avoids rebuilding them entry by entry
+    if all(type(key) is str and type(value) in _CLEAN_TYPES
+           for key, value in data.items()):
+        return data
     result = {}
     for key, value in data.items():
         # Ensure key is a string
@@ -64,6 +126,23 @@ def normalize_dict(data: Dict) -> Dict:
     return result
 
 
+# Exact types whose values pass through normalize_value unchanged; float is
+# excluded because NaN/inf still need mapping to None
+_CLEAN_TYPES = frozenset((type(None), bool, int, str))
+
+_DISPATCH = {
+    type(None): lambda value: None,
+    bool: lambda value: value,
+    int: lambda value: value,
+    str: lambda value: value,
+    float: _normalize_float,
+    pd.Timestamp: _normalize_timestamp,
+    datetime: _normalize_timestamp,
+    dict: normalize_dict,
+    list: lambda value: [normalize_value(item) for item in value],
+}
+
+
 def safe_float(value: Any, default: Optional[float] = None) -> Optional[float]:
     """
     Safely convert value to float.
@@ -75,9 +154,9 @@ def safe_float(value: Any, default: Optional[float] = None) -> Optional[float]:
     Returns:
         Float value or default
     """
+    if value is None or (isinstance(value, float) and value != value):
+        return default
     try:
-        if value is None or (isinstance(value, float) and pd.isna(value)):
-            return default
         return float(value)
     except (ValueError, TypeError):
         return default
@@ -94,9 +173,9 @@ def safe_int(value: Any, default: Optional[int] = None) -> Optional[int]:
     Returns:
         Int value or default
     """
+    if value is None or (isinstance(value, float) and value != value):
+        return default
     try:
-        if value is None or (isinstance(value, float) and pd.isna(value)):
-            return default
         return int(value)
     except (ValueError, TypeError):
         return default
@@ -113,9 +192,9 @@ def safe_str(value: Any, default: str = "") -> str:
     Returns:
         String value or default
     """
+    if value is None or (isinstance(value, float) and value != value):
+        return default
     try:
-        if value is None or (isinstance(value, float) and pd.isna(value)):
-            return default
         return str(value)
     except (ValueError, TypeError):
         return default
@@ -6,15 +6,99 @@ Support for PDF, CSV, TXT, JSON, and web content extraction.
 import base64
 import io
 import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Tuple, Optional
 import pandas as pd
 import pypdf
 import requests
 from bs4 import BeautifulSoup
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pragma: no cover - exercised only without the extra
+    pdfium = None
+
+try:
+    from selectolax.parser import HTMLParser as _LexborParser
+except ImportError:  # pragma: no cover - exercised only without the extra
+    _LexborParser = None
+
+from ..data.parsers import dumps
 from ..utils.exceptions import DocumentProcessingError
 
 
+# Page count above which extraction is farmed out to a process pool;
+# text extraction is CPU-bound, so large filings scale with core count
+_LARGE_PDF_PAGES = 16
+
+
+def _extract_page(data: bytes, page_index: int) -> str:
+    """
+    Extract text from one PDF page.
+
+    Top-level (pickleable) so it can run in worker processes; each worker
+    opens its own document from the raw bytes.
+
+    Args:
+        data: PDF file content
+        page_index: Zero-based page number
+
+    Returns:
+        Extracted text for the page
+    """
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(data)
+        try:
+            page = pdf[page_index]
+            textpage = page.get_textpage()
+            try:
+                return textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+
+    pdf_file = pypdf.PdfReader(io.BytesIO(data))
+    return pdf_file.pages[page_index].extract_text() or ""
+
+
+def _extract_pdf_text(data: bytes) -> str:
+    """
+    Extract text from PDF bytes.
+
+    Prefers pypdfium2 (C++-backed, several times faster than pypdf on
+    multi-page documents) when installed, falling back to pypdf. Page
+    texts are accumulated in a list and joined once instead of quadratic
+    string concatenation. Documents above _LARGE_PDF_PAGES pages are
+    extracted in a process pool, one worker per core.
+
+    Args:
+        data: PDF file content
+
+    Returns:
+        Extracted text for all pages
+    """
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(data)
+        n_pages = len(pdf)
+        pdf.close()
+        separator = "\n"
+    else:
+        pdf_file = pypdf.PdfReader(io.BytesIO(data))
+        n_pages = len(pdf_file.pages)
+        separator = ""
+
+    if n_pages > _LARGE_PDF_PAGES:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            parts = list(executor.map(_extract_page, [data] * n_pages,
+                                      range(n_pages), chunksize=4))
+    else:
+        parts = [_extract_page(data, i) for i in range(n_pages)]
+    return separator.join(parts)
+
+
 def extract_data_from_file(file_extension: str, data: bytes) -> str:
     """
     Extract text data from various file formats.
@@ -33,13 +117,8 @@ def extract_data_from_file(file_extension: str, data: bytes) -> str:
         text = ""
         
         if file_extension in [".pdf", "pdf"]:
-            file_data_bytes = io.BytesIO(data)
-            pdf_file = pypdf.PdfReader(file_data_bytes)
-            text = ""
-            for page_num in range(len(pdf_file.pages)):
-                page = pdf_file.pages[page_num]
-                text += page.extract_text()
-                
+            text = _extract_pdf_text(data)
+
         elif file_extension in [".txt", ".plain", "txt", "plain"]:
             text = data.decode('utf-8', errors='ignore')
             
@@ -53,7 +132,7 @@ def extract_data_from_file(file_extension: str, data: bytes) -> str:
             data_str = data.decode("utf-8", errors='ignore')
             df = pd.read_csv(io.StringIO(data_str))
             # Limit to first 100 rows to avoid huge payloads
-            text = df.head(100).to_json()
+            text = dumps(df.head(100).to_dict(orient='records'))
         else:
             raise DocumentProcessingError(f"Unsupported file extension: {file_extension}")
         
@@ -81,35 +160,90 @@ def extract_article_content(url: str, max_length: int = 10000) -> Tuple[str, str
         # Send a GET request to the URL
         response = requests.get(url, timeout=30)
         response.raise_for_status()
-        
-        # Parse the HTML content of the page
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        # Find the title of the article
-        title_tag = soup.find("title")
-        title = title_tag.get_text() if title_tag else "No Title"
-
-        # Find the main content of the article
-        # Try article tag first
-        article_content = soup.find("article")
-        if article_content:
-            article_text = article_content.get_text(separator="\n")
-            return title.strip(), article_text.strip()[:max_length]
-        
-        # Fall back to body
-        body_content = soup.find("body")
-        if body_content:
-            body_text = body_content.get_text(separator="\n")
-            return title.strip(), body_text.strip()[:max_length]
-        
-        return title.strip(), "Main content not found."
-        
+
+        return _parse_html(response.content, max_length)
+
     except requests.RequestException as e:
         raise DocumentProcessingError(f"Failed to fetch URL: {str(e)}")
     except Exception as e:
         raise DocumentProcessingError(f"Failed to extract article content: {str(e)}")
 
 
+def _parse_html(content: bytes, max_length: int = 10000) -> Tuple[str, str]:
+    """
+    Parse HTML content into (title, article text).
+
+    Args:
+        content: Raw HTML bytes
+        max_length: Maximum content length to return
+
+    Returns:
+        Tuple of (title, content)
+    """
+    # selectolax's C-level lexbor parser is ~20-30x faster than
+    # bs4 + html.parser; use it when the 'speed' extra is installed
+    if _LexborParser is not None:
+        tree = _LexborParser(content)
+        title_node = tree.css_first('title')
+        title = title_node.text(strip=True) if title_node else "No Title"
+        node = tree.css_first('article') or tree.css_first('body')
+        if node:
+            return title, node.text(separator='\n', strip=True)[:max_length]
+        return title, "Main content not found."
+
+    soup = BeautifulSoup(content, "html.parser")
+
+    # Find the title of the article
+    title_tag = soup.find("title")
+    title = title_tag.get_text() if title_tag else "No Title"
+
+    # Find the main content of the article
+    # Try article tag first
+    article_content = soup.find("article")
+    if article_content:
+        article_text = article_content.get_text(separator="\n")
+        return title.strip(), article_text.strip()[:max_length]
+
+    # Fall back to body
+    body_content = soup.find("body")
+    if body_content:
+        body_text = body_content.get_text(separator="\n")
+        return title.strip(), body_text.strip()[:max_length]
+
+    return title.strip(), "Main content not found."
+
+
+def extract_articles_many(urls: list, max_length: int = 10000,
+                          concurrency: int = 10) -> dict:
+    """
+    Extract article content from many URLs concurrently.
+
+    Downloads are network-bound, so fetching N articles through a thread
+    pool costs roughly one round-trip of wall-clock instead of N.
+
+    Args:
+        urls: URLs to extract content from
+        max_length: Maximum content length per article
+        concurrency: Maximum number of concurrent downloads
+
+    Returns:
+        Dictionary mapping each URL to its (title, content) tuple.
+        URLs that fail are reported via warnings.warn and map to None.
+    """
+    if not urls:
+        return {}
+
+    def _one(url: str):
+        try:
+            return extract_article_content(url, max_length)
+        except DocumentProcessingError as exc:
+            warnings.warn(f"extract_articles_many: {url} failed: {exc}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(urls))) as executor:
+        return dict(zip(urls, executor.map(_one, urls)))
+
+
 def get_file_data_from_url(file_url: str, max_length: int = 5000) -> Tuple[str, str]:
     """
     Download file from URL and extract its content.
@@ -138,6 +272,41 @@ def get_file_data_from_url(file_url: str, max_length: int = 5000) -> Tuple[str,
         raise DocumentProcessingError(f"Failed to extract file data: {str(e)}")
 
 
+def get_files_data_from_urls(file_urls: list, max_length: int = 5000,
+                             concurrency: Optional[int] = None) -> dict:
+    """
+    Download and extract many files concurrently.
+
+    Each worker runs the full (download, parse) pair, so while one thread
+    blocks on the network the others can parse: a batch costs roughly
+    max(total download, total parse) instead of their sum. Large PDFs
+    still fan their pages out to the process pool via _extract_pdf_text.
+
+    Args:
+        file_urls: URLs of the files
+        max_length: Maximum content length per file
+        concurrency: Maximum number of concurrent workers
+                     (defaults to CPU count, capped at the batch size)
+
+    Returns:
+        Dictionary mapping each URL to its (extracted_text, file_extension)
+        tuple. URLs that fail are reported via warnings.warn and map to None.
+    """
+    if not file_urls:
+        return {}
+
+    def _one(url: str):
+        try:
+            return get_file_data_from_url(url, max_length)
+        except DocumentProcessingError as exc:
+            warnings.warn(f"get_files_data_from_urls: {url} failed: {exc}")
+            return None
+
+    workers = min(concurrency or os.cpu_count() or 4, len(file_urls))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(file_urls, executor.map(_one, file_urls)))
+
+
 def get_file_extension(url: str) -> str:
     """
     Get file extension from URL.
@@ -163,19 +332,38 @@ def sanitize_base64_document(base64_document: bytes) -> str:
         Sanitized base64 string
     """
     try:
-        base64_encoded_str = base64.encodebytes(base64_document).decode()
-        
+        # Input is already base64; a decode is all that's needed instead of
+        # re-encoding through base64.encodebytes and its newline insertion
+        if isinstance(base64_document, bytes):
+            base64_encoded_str = base64_document.decode('ascii', errors='ignore')
+        else:
+            base64_encoded_str = base64_document
+
         # Remove data URI prefix if present
-        if "," in base64_encoded_str:
-            # Format: "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD"
-            return base64_encoded_str.split(",")[1]
-        
+        # Format: "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD"
+        comma = base64_encoded_str.find(",")
+        if comma != -1 and base64_encoded_str.startswith("data:"):
+            return base64_encoded_str[comma + 1:]
+
         return base64_encoded_str
-        
+
     except Exception as e:
         raise DocumentProcessingError(f"Failed to sanitize base64 document: {str(e)}")
 
 
+def encode_bytes_to_base64(raw: bytes) -> str:
+    """
+    Encode raw bytes to a base64 string.
+
+    Args:
+        raw: Raw document bytes
+
+    Returns:
+        Base64 string without newlines (single allocation)
+    """
+    return base64.b64encode(raw).decode('ascii')
+
+
 def is_valid_url(url: str) -> bool:
     """
     Check if a string is a valid URL.
@@ -6,6 +6,22 @@ Text cleaning, normalization, and formatting.
 import re
 from typing import Optional
 
+# Patterns compiled once at import: these functions run per document in
+# loops, so skipping re's per-call cache probe adds up
+_WS_RE = re.compile(r'\s+')
+# Atomic fractional part: the engine never backtracks on a trailing '.'
+_NUM_RE = re.compile(r'-?\d+(?:\.\d+)?')
+_URL_RE = re.compile(r'https?://\S+')
+_SENT_RE = re.compile(r'[.!?]+')
+_MULTISPACE_RE = re.compile(r' +')
+_MULTINL_RE = re.compile(r'\n\n+')
+
+# Deletion table for control characters, excluding the whitespace ones
+# (\t \n \x0b \x0c \r \x85) which the whitespace collapse turns into
+# spaces -- str.translate removes the rest in a single C pass
+_CTRL_TABLE = {c: None for c in list(range(0x00, 0x20)) + list(range(0x7f, 0xa0))
+               if c not in (0x09, 0x0a, 0x0b, 0x0c, 0x0d, 0x85)}
+
 
 def truncate_text(text: str, max_length: int = 5000, suffix: str = "...") -> str:
     """
@@ -38,16 +54,10 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove control characters
-    text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-    
-    # Trim
-    text = text.strip()
-    
-    return text
+    # Remove control characters (C-level translate), then collapse all
+    # whitespace and trim in one regex pass instead of two
+    text = text.translate(_CTRL_TABLE)
+    return _WS_RE.sub(' ', text).strip()
 
 
 def extract_numbers(text: str) -> list:
@@ -61,10 +71,21 @@ def extract_numbers(text: str) -> list:
         List of numbers found
     """
     # Match integers and floats
-    pattern = r'-?\d+\.?\d*'
-    matches = re.findall(pattern, text)
-    
-    return [float(m) for m in matches if m]
+    return list(iter_numbers(text))
+
+
+def iter_numbers(text: str):
+    """
+    Lazily yield numbers found in text.
+
+    Args:
+        text: Text to extract from
+
+    Yields:
+        Numbers as floats, in order of appearance
+    """
+    for match in _NUM_RE.finditer(text):
+        yield float(match.group())
 
 
 def remove_urls(text: str) -> str:
@@ -77,9 +98,8 @@ def remove_urls(text: str) -> str:
     Returns:
         Text with URLs removed
     """
-    # Remove URLs
-    pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    text = re.sub(pattern, '', text)
+    # Remove URLs (the old giant alternation also had broken escapes)
+    text = _URL_RE.sub('', text)
     
     return text
 
@@ -96,7 +116,7 @@ def extract_sentences(text: str, max_sentences: Optional[int] = None) -> list:
         List of sentences
     """
     # Simple sentence splitting (can be improved)
-    sentences = re.split(r'[.!?]+', text)
+    sentences = _SENT_RE.split(text)
     sentences = [s.strip() for s in sentences if s.strip()]
     
     if max_sentences:
@@ -116,8 +136,18 @@ def summarize_text(text: str, max_length: int = 500) -> str:
     Returns:
         Summarized text
     """
+    if not text:
+        return ""
+
+    # Already short and clean: skip the regex passes entirely. The
+    # substring checks are single C-level scans, far cheaper than running
+    # clean_text on input that has nothing to fix
+    if (len(text) <= max_length and '  ' not in text
+            and '\n' not in text and '\t' not in text):
+        return text.strip()
+
     text = clean_text(text)
-    
+
     if len(text) <= max_length:
         return text
     
@@ -141,11 +171,16 @@ def normalize_whitespace(text: str) -> str:
     Returns:
         Normalized text
     """
+    # Fast path for already-normalized text: no run of spaces or newlines
+    # to collapse means both substitutions would be no-ops
+    if '  ' not in text and '\n\n\n' not in text:
+        return text.strip()
+
     # Replace multiple spaces with single space
-    text = re.sub(r' +', ' ', text)
-    
+    text = _MULTISPACE_RE.sub(' ', text)
+
     # Replace multiple newlines with double newline
-    text = re.sub(r'\n\n+', '\n\n', text)
+    text = _MULTINL_RE.sub('\n\n', text)
     
     return text.strip()
 
@@ -161,13 +196,9 @@ def format_for_ai(text: str, max_length: int = 10000) -> str:
     Returns:
         Formatted text
     """
-    # Clean the text
+    # clean_text already collapses every whitespace run (newlines included),
+    # so a separate normalize_whitespace pass would be a no-op
     text = clean_text(text)
-    
-    # Normalize whitespace
-    text = normalize_whitespace(text)
-    
+
     # Truncate if needed
-    text = truncate_text(text, max_length)
-    
-    return text
+    return truncate_text(text, max_length)
@@ -3,10 +3,32 @@ Formatting utilities for InvestorMate.
 Pretty printing for financial data, tables, and reports.
 """
 
+import sys
+from functools import lru_cache
+from math import log10
 from typing import Dict, Any, Optional, List
+import numpy as np
 import pandas as pd
 
 
+def _is_missing(value: Any) -> bool:
+    """
+    Check whether a scalar should display as "N/A".
+
+    Plain None and float NaN are caught without touching pandas; only
+    pandas' own sentinels (pd.NA, pd.NaT) fall back to pd.isna, keeping
+    its dispatch and try/except off the per-cell hot path.
+    """
+    if value is None or (isinstance(value, float) and value != value):
+        return True
+    if type(value).__module__.startswith("pandas"):
+        try:
+            return bool(pd.isna(value))
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
 def format_number(value: Any, decimals: int = 2, prefix: str = "", suffix: str = "") -> str:
     """
     Format a number for display.
@@ -20,24 +42,23 @@ def format_number(value: Any, decimals: int = 2, prefix: str = "", suffix: str =
     Returns:
         Formatted string
     """
-    if value is None:
+    if _is_missing(value):
         return "N/A"
-    
-    # Handle pandas NA/NaN
-    try:
-        if pd.isna(value):
-            return "N/A"
-    except (TypeError, ValueError):
-        pass
-    
+
     try:
-        num_value = float(value)
-        formatted = f"{num_value:,.{decimals}f}"
-        return f"{prefix}{formatted}{suffix}"
+        return _format_number_cached(float(value), decimals, prefix, suffix)
     except (ValueError, TypeError):
         return str(value)
 
 
+# Dashboards re-format the same cells on every render; floats are hashable,
+# so memoizing the formatted string turns repeats into a dict lookup
+@lru_cache(maxsize=4096)
+def _format_number_cached(num_value: float, decimals: int, prefix: str, suffix: str) -> str:
+    formatted = f"{num_value:,.{decimals}f}"
+    return f"{prefix}{formatted}{suffix}"
+
+
 def format_large_number(value: Any, decimals: int = 2) -> str:
     """
     Format large numbers with K/M/B/T suffixes.
@@ -49,32 +70,36 @@ def format_large_number(value: Any, decimals: int = 2) -> str:
     Returns:
         Formatted string (e.g., "1.5B", "234.5M")
     """
-    if value is None:
+    if _is_missing(value):
         return "N/A"
-    
-    try:
-        if pd.isna(value):
-            return "N/A"
-    except (TypeError, ValueError):
-        pass
-    
+
     try:
-        num_value = float(value)
-        
-        if abs(num_value) >= 1_000_000_000_000:
-            return f"{num_value / 1_000_000_000_000:.{decimals}f}T"
-        elif abs(num_value) >= 1_000_000_000:
-            return f"{num_value / 1_000_000_000:.{decimals}f}B"
-        elif abs(num_value) >= 1_000_000:
-            return f"{num_value / 1_000_000:.{decimals}f}M"
-        elif abs(num_value) >= 1_000:
-            return f"{num_value / 1_000:.{decimals}f}K"
-        else:
-            return f"{num_value:.{decimals}f}"
+        return _format_large_number_cached(float(value), decimals)
     except (ValueError, TypeError):
         return str(value)
 
 
+# Magnitude scaling resolved by a log10 table lookup instead of a branch
+# ladder: one math call and two tuple indexes classify any value
+_SUFFIXES = ("", "K", "M", "B", "T")
+_DIVISORS = (1.0, 1e3, 1e6, 1e9, 1e12)
+
+
+def _scale(num_value: float):
+    """Scale a number into its K/M/B/T band; returns (scaled, suffix)."""
+    absv = abs(num_value)
+    if absv < 1000:
+        return num_value, ""
+    exp = min(int(log10(absv) // 3), 4)
+    return num_value / _DIVISORS[exp], _SUFFIXES[exp]
+
+
+@lru_cache(maxsize=4096)
+def _format_large_number_cached(num_value: float, decimals: int) -> str:
+    scaled, unit = _scale(num_value)
+    return f"{scaled:.{decimals}f}{unit}"
+
+
 def format_percentage(value: Any, decimals: int = 2) -> str:
     """
     Format percentage value.
@@ -86,23 +111,20 @@ def format_percentage(value: Any, decimals: int = 2) -> str:
     Returns:
         Formatted percentage string
     """
-    if value is None:
+    if _is_missing(value):
         return "N/A"
-    
-    try:
-        if pd.isna(value):
-            return "N/A"
-    except (TypeError, ValueError):
-        pass
-    
+
     try:
-        num_value = float(value)
-        percentage = num_value * 100
-        return f"{percentage:.{decimals}f}%"
+        return _format_percentage_cached(float(value), decimals)
     except (ValueError, TypeError):
         return str(value)
 
 
+@lru_cache(maxsize=4096)
+def _format_percentage_cached(num_value: float, decimals: int) -> str:
+    return f"{num_value * 100:.{decimals}f}%"
+
+
 def format_currency(value: Any, decimals: int = 2, currency: str = "$") -> str:
     """
     Format currency value.
@@ -118,6 +140,35 @@ def format_currency(value: Any, decimals: int = 2, currency: str = "$") -> str:
     return format_number(value, decimals=decimals, prefix=currency)
 
 
+def _format_large_values(arr: "np.ndarray", decimals: int = 2) -> "np.ndarray":
+    """
+    Vectorized equivalent of format_large_number for a float matrix.
+
+    Cells are banded by magnitude with boolean masks and each band is
+    formatted in one np.char.mod call, so an N x M statement costs a
+    handful of C loops instead of N*M Python calls. NaN cells (including
+    metrics missing in a period) come out as "N/A".
+
+    Args:
+        arr: 2-D float array of statement values
+        decimals: Decimal places
+
+    Returns:
+        Object array of formatted strings, same shape as arr
+    """
+    out = np.full(arr.shape, "N/A", dtype=object)
+    absarr = np.abs(arr)
+    remaining = ~np.isnan(arr)
+    for scale, unit in ((1e12, "T"), (1e9, "B"), (1e6, "M"), (1e3, "K")):
+        mask = remaining & (absarr >= scale)
+        if mask.any():
+            out[mask] = np.char.mod(f"%.{decimals}f{unit}", arr[mask] / scale)
+            remaining &= ~mask
+    if remaining.any():
+        out[remaining] = np.char.mod(f"%.{decimals}f", arr[remaining])
+    return out
+
+
 def print_financial_statement(
     data: Dict,
     title: str = "Financial Statement",
@@ -148,33 +199,78 @@ def print_financial_statement(
     
     all_metrics = sorted(all_metrics)
     
-    # Calculate column widths
+    # Calculate column widths and separators once, up front
     metric_width = max(len(str(m)) for m in all_metrics) + 2
-    date_width = max(len(str(d)) for d in data.keys()) + 2
     value_width = 15
-    
-    # Print header
-    print(f"\n{'=' * (metric_width + len(data) * value_width + 4)}")
-    print(f"{title.center(metric_width + len(data) * value_width + 4)}")
-    print(f"{'=' * (metric_width + len(data) * value_width + 4)}\n")
-    
-    # Print column headers
-    header = f"{'Metric'.ljust(metric_width)}"
-    for date in sorted(data.keys(), reverse=True):
-        header += f"{str(date)[:10].rjust(value_width)}"
-    print(header)
-    print("-" * (metric_width + len(data) * value_width))
-    
-    # Print rows
-    for metric in all_metrics:
-        row = f"{str(metric).ljust(metric_width)}"
-        for date in sorted(data.keys(), reverse=True):
-            value = data[date].get(metric)
-            formatted_value = value_formatter(value) if value is not None else "N/A"
-            row += f"{formatted_value.rjust(value_width)}"
-        print(row)
-    
-    print()
+    total_width = metric_width + len(data) * value_width + 4
+    sep = "=" * total_width
+    dash = "-" * (metric_width + len(data) * value_width)
+
+    # Rows are buffered and flushed in one write at the end: one stdout
+    # syscall per table instead of one per line
+    lines = ["", sep, title.center(total_width), sep, ""]
+
+    sorted_dates = sorted(data.keys(), reverse=True)
+
+    # With the default formatter the whole grid is formatted up front in a
+    # few vectorized band operations; custom formatters (or non-numeric
+    # data) keep the per-cell path
+    formatted = None
+    if value_formatter is format_large_number:
+        try:
+            grid = df.reindex(index=all_metrics, columns=sorted_dates)
+            formatted = _format_large_values(grid.to_numpy(dtype=float))
+        except (TypeError, ValueError):
+            formatted = None
+
+    # Column headers
+    header_parts = ['Metric'.ljust(metric_width)]
+    header_parts.extend(str(date)[:10].rjust(value_width) for date in sorted_dates)
+    lines.append("".join(header_parts))
+    lines.append(dash)
+
+    # Rows
+    for i, metric in enumerate(all_metrics):
+        row_parts = [str(metric).ljust(metric_width)]
+        for j, date in enumerate(sorted_dates):
+            if formatted is not None:
+                formatted_value = formatted[i, j]
+            else:
+                value = data[date].get(metric)
+                formatted_value = value_formatter(value) if value is not None else "N/A"
+            row_parts.append(formatted_value.rjust(value_width))
+        lines.append("".join(row_parts))
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Ratio categories in display order, inverted once into a ratio -> category
+# lookup so bucketing is a single pass over the ratios dict instead of a
+# scan of every category per ratio
+_CATEGORIES = {
+    'Valuation': ['pe', 'peg', 'pb', 'ps', 'ev_ebitda', 'ev_revenue', 'ttm_pe'],
+    'Profitability': ['roe', 'roa', 'roic', 'profit_margin', 'operating_margin', 'gross_margin', 'ebitda_margin'],
+    'Liquidity': ['current_ratio', 'quick_ratio', 'cash_ratio'],
+    'Leverage': ['debt_to_equity', 'debt_to_assets', 'equity_ratio', 'equity_multiplier', 'interest_coverage', 'wacc'],
+    'Efficiency': ['asset_turnover', 'inventory_turnover', 'receivables_turnover'],
+    'Growth': ['revenue_growth', 'earnings_growth', 'eps_growth'],
+    'Dividend': ['dividend_yield', 'payout_ratio'],
+    'TTM Metrics': ['ttm_eps', 'ttm_revenue', 'ttm_net_income', 'ttm_ebitda']
+}
+
+_RATIO_TO_CAT = {key: cat for cat, keys in _CATEGORIES.items() for key in keys}
+
+# Formatting style per known ratio key, resolved to O(1) set membership
+# instead of per-ratio substring scans
+_PCT_KEYS = frozenset(
+    key for key in _RATIO_TO_CAT
+    if any(x in key for x in ('margin', 'yield', 'growth', 'roe', 'roa', 'roic', 'wacc'))
+)
+_LARGE_KEYS = frozenset(
+    key for key in _RATIO_TO_CAT
+    if 'ttm_' in key and key not in ('ttm_eps', 'ttm_pe')
+)
 
 
 def print_ratios_table(ratios: Dict[str, Any], title: str = "Financial Ratios") -> None:
@@ -189,44 +285,38 @@ def print_ratios_table(ratios: Dict[str, Any], title: str = "Financial Ratios")
         print(f"\n{title}: No data available\n")
         return
     
-    print(f"\n{'=' * 60}")
-    print(f"{title.center(60)}")
-    print(f"{'=' * 60}\n")
-    
-    # Group ratios by category
-    categories = {
-        'Valuation': ['pe', 'peg', 'pb', 'ps', 'ev_ebitda', 'ev_revenue', 'ttm_pe'],
-        'Profitability': ['roe', 'roa', 'roic', 'profit_margin', 'operating_margin', 'gross_margin', 'ebitda_margin'],
-        'Liquidity': ['current_ratio', 'quick_ratio', 'cash_ratio'],
-        'Leverage': ['debt_to_equity', 'debt_to_assets', 'equity_ratio', 'equity_multiplier', 'interest_coverage', 'wacc'],
-        'Efficiency': ['asset_turnover', 'inventory_turnover', 'receivables_turnover'],
-        'Growth': ['revenue_growth', 'earnings_growth', 'eps_growth'],
-        'Dividend': ['dividend_yield', 'payout_ratio'],
-        'TTM Metrics': ['ttm_eps', 'ttm_revenue', 'ttm_net_income', 'ttm_ebitda']
-    }
-    
-    for category, ratio_keys in categories.items():
-        category_ratios = {k: v for k, v in ratios.items() if k in ratio_keys and v is not None}
-        
+    lines = ["", "=" * 60, title.center(60), "=" * 60, ""]
+
+    # Bucket ratios by category in a single pass over the input
+    buckets = {category: [] for category in _CATEGORIES}
+    for ratio_name, ratio_value in ratios.items():
+        if ratio_value is None:
+            continue
+        category = _RATIO_TO_CAT.get(ratio_name)
+        if category:
+            buckets[category].append((ratio_name, ratio_value))
+
+    for category, category_ratios in buckets.items():
         if category_ratios:
-            print(f"\n{category}:")
-            print("-" * 60)
-            
-            for ratio_name, ratio_value in category_ratios.items():
+            lines.append(f"\n{category}:")
+            lines.append("-" * 60)
+
+            for ratio_name, ratio_value in category_ratios:
                 # Format ratio name
                 display_name = ratio_name.replace('_', ' ').title()
-                
+
                 # Format value based on ratio type
-                if any(x in ratio_name for x in ['margin', 'yield', 'growth', 'roe', 'roa', 'roic', 'wacc']):
+                if ratio_name in _PCT_KEYS:
                     formatted_value = format_percentage(ratio_value)
-                elif 'ttm_' in ratio_name and ratio_name not in ['ttm_eps', 'ttm_pe']:
+                elif ratio_name in _LARGE_KEYS:
                     formatted_value = format_large_number(ratio_value)
                 else:
                     formatted_value = format_number(ratio_value)
-                
-                print(f"  {display_name.ljust(30)}: {formatted_value.rjust(20)}")
-    
-    print()
+
+                lines.append(f"  {display_name.ljust(30)}: {formatted_value.rjust(20)}")
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_comparison_table(
@@ -246,31 +336,32 @@ def print_comparison_table(
         print(f"\n{title}: No data available\n")
         return
     
-    # Calculate column widths
+    # Calculate column widths and separators once, up front
     metric_width = max(len(str(m)) for m in metrics.keys()) + 2
     stock_width = 15
-    
-    print(f"\n{'=' * (metric_width + len(stocks) * stock_width + 4)}")
-    print(f"{title.center(metric_width + len(stocks) * stock_width + 4)}")
-    print(f"{'=' * (metric_width + len(stocks) * stock_width + 4)}\n")
-    
-    # Print header
-    header = f"{'Metric'.ljust(metric_width)}"
-    for stock in stocks:
-        header += f"{stock.rjust(stock_width)}"
-    print(header)
-    print("-" * (metric_width + len(stocks) * stock_width))
-    
-    # Print rows
+    total_width = metric_width + len(stocks) * stock_width + 4
+    sep = "=" * total_width
+    dash = "-" * (metric_width + len(stocks) * stock_width)
+
+    lines = ["", sep, title.center(total_width), sep, ""]
+
+    # Column headers
+    header_parts = ['Metric'.ljust(metric_width)]
+    header_parts.extend(stock.rjust(stock_width) for stock in stocks)
+    lines.append("".join(header_parts))
+    lines.append(dash)
+
+    # Rows
     for metric_name, values in metrics.items():
-        row = f"{metric_name.ljust(metric_width)}"
+        row_parts = [metric_name.ljust(metric_width)]
         for stock in stocks:
             value = values.get(stock)
             formatted = format_number(value) if value is not None else "N/A"
-            row += f"{formatted.rjust(stock_width)}"
-        print(row)
-    
-    print()
+            row_parts.append(formatted.rjust(stock_width))
+        lines.append("".join(row_parts))
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_dataframe_pretty(
@@ -297,14 +388,22 @@ def print_dataframe_pretty(
         print(f"{title.center(80)}")
         print(f"{'=' * 80}\n")
     
-    # Set pandas display options temporarily
-    with pd.option_context(
-        'display.max_rows', max_rows,
-        'display.max_columns', max_cols,
-        'display.width', 120,
-        'display.precision', 2,
-        'display.float_format', '{:,.2f}'.format
-    ):
+    # Set display options directly and restore in finally, skipping
+    # pd.option_context's per-option stack machinery
+    desired = (
+        ('display.max_rows', max_rows),
+        ('display.max_columns', max_cols),
+        ('display.width', 120),
+        ('display.precision', 2),
+        ('display.float_format', '{:,.2f}'.format),
+    )
+    saved = [(name, pd.get_option(name)) for name, _ in desired]
+    try:
+        for name, value in desired:
+            pd.set_option(name, value)
         print(df)
-    
+    finally:
+        for name, value in saved:
+            pd.set_option(name, value)
+
     print()
@@ -2,9 +2,16 @@
 Helper utilities for InvestorMate.
 """
 
+import io
+from itertools import islice
 from typing import Any, Dict, List, Optional
 import json
 
+from .formatters import _format_large_number_cached
+
+# Sentinel distinguishing "key absent" from a stored None
+_MISSING = object()
+
 
 def format_currency(value: Optional[float], currency: str = "USD") -> str:
     """
@@ -21,15 +28,10 @@ def format_currency(value: Optional[float], currency: str = "USD") -> str:
         return "N/A"
     
     symbol = "$" if currency == "USD" else currency
-    
-    if abs(value) >= 1_000_000_000:
-        return f"{symbol}{value / 1_000_000_000:.2f}B"
-    elif abs(value) >= 1_000_000:
-        return f"{symbol}{value / 1_000_000:.2f}M"
-    elif abs(value) >= 1_000:
-        return f"{symbol}{value / 1_000:.2f}K"
-    else:
-        return f"{symbol}{value:.2f}"
+
+    # Delegates to the shared cached core in formatters, so both modules
+    # run (and memoize through) a single formatting code path
+    return symbol + _format_large_number_cached(float(value), 2)
 
 
 def format_percentage(value: Optional[float], decimal_places: int = 2) -> str:
@@ -71,38 +73,53 @@ def safe_divide(numerator: Optional[float], denominator: Optional[float],
         return default
 
 
-def truncate_text(text: str, max_length: int = 5000, suffix: str = "...") -> str:
+_ELLIPSIS = "..."
+_ELLIPSIS_LEN = len(_ELLIPSIS)
+
+
+def truncate_text(text: str, max_length: int = 5000, suffix: str = _ELLIPSIS) -> str:
     """
     Truncate text to maximum length.
-    
+
     Args:
         text: Text to truncate
         max_length: Maximum length
         suffix: Suffix to add if truncated
-        
+
     Returns:
         Truncated text
     """
     if not text or len(text) <= max_length:
         return text
-    
-    return text[:max_length - len(suffix)] + suffix
+
+    # Identity check keeps the default path from re-measuring the suffix
+    suffix_len = _ELLIPSIS_LEN if suffix is _ELLIPSIS else len(suffix)
+    return text[:max_length - suffix_len] + suffix
+
+
+_LIST_LIKE = (tuple, set, frozenset)
 
 
 def ensure_list(value: Any) -> List:
     """
     Ensure value is a list.
-    
+
     Args:
         value: Value to convert
-        
+
     Returns:
         List containing the value(s)
     """
     if value is None:
         return []
+    # Exact-type pointer compare on the hot path; isinstance's MRO walk
+    # only runs for list subclasses and other list-likes
+    if type(value) is list:
+        return value
     if isinstance(value, list):
         return value
+    if isinstance(value, _LIST_LIKE):
+        return list(value)
     return [value]
 
 
@@ -116,28 +133,54 @@ def merge_dicts(*dicts: Dict) -> Dict:
     Returns:
         Merged dictionary
     """
+    present = [d for d in dicts if d]
+    if not present:
+        return {}
+    if len(present) == 1:
+        return dict(present[0])
+    if len(present) == 2:
+        # Single C-level DICT_MERGE for the common two-dict case
+        return {**present[0], **present[1]}
     result = {}
-    for d in dicts:
-        if d:
-            result.update(d)
+    for d in present:
+        result.update(d)
     return result
 
 
+def write_json(data: Any, fp, indent: int = 2) -> None:
+    """
+    Write data as pretty-printed JSON into a file object.
+
+    Serialization happens fully before anything is written, so a payload
+    that fails to serialize (e.g. a circular reference) falls back to its
+    str() form instead of appending it to a half-written document.
+
+    Args:
+        data: Data to serialize
+        fp: Writable file object
+        indent: Indentation level
+    """
+    try:
+        text = json.dumps(data, indent=indent, default=str)
+    except (ValueError, TypeError):
+        text = str(data)
+    fp.write(text)
+
+
 def pretty_print_json(data: Any, indent: int = 2) -> str:
     """
     Pretty print data as JSON.
-    
+
     Args:
         data: Data to print
         indent: Indentation level
-        
+
     Returns:
         Pretty-printed JSON string
     """
-    try:
-        return json.dumps(data, indent=indent, default=str)
-    except (ValueError, TypeError):
-        return str(data)
+    buf = io.StringIO()
+    write_json(data, buf, indent)
+    return buf.getvalue()
 
 
 def get_nested_value(data: Dict, keys: List[str], default: Any = None) -> Any:
@@ -152,24 +195,42 @@ def get_nested_value(data: Dict, keys: List[str], default: Any = None) -> Any:
     Returns:
         Value or default
     """
-    try:
-        result = data
-        for key in keys:
-            result = result[key]
-        return result
-    except (KeyError, TypeError, IndexError):
-        return default
+    current = data
+    for key in keys:
+        if isinstance(current, dict):
+            # Sentinel-based get keeps the common "missing key" case off
+            # the exception machinery entirely
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
+                return default
+        elif isinstance(current, (list, tuple)):
+            try:
+                current = current[key]
+            except (IndexError, TypeError):
+                return default
+        else:
+            return default
+    return current
 
 
-def batch_items(items: List, batch_size: int = 10) -> List[List]:
+def batch_items(items: Any, batch_size: int = 10):
     """
-    Batch items into groups.
-    
+    Batch items into groups, lazily.
+
+    Batches are produced one at a time, so peak memory stays O(batch_size)
+    and the input can be any iterable, not just a list. Wrap in list() when
+    a materialized list of batches is needed.
+
     Args:
-        items: List of items
+        items: Iterable of items
         batch_size: Size of each batch
-        
-    Returns:
-        List of batches
+
+    Yields:
+        Lists of up to batch_size items
     """
-    return [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, batch_size))
+        if not chunk:
+            return
+        yield chunk
@@ -2,9 +2,25 @@
 Input validation utilities for InvestorMate.
 """
 
+import re
+from datetime import date
+from functools import lru_cache
 from typing import Optional
 from .exceptions import InvalidTickerError, APIKeyError, ValidationError
 
+# Compiled once at import: one C-level match covers both the length and
+# character-set rules, with no backtracking possible on this pattern
+_TICKER_RE = re.compile(r"\A[A-Z0-9._\-&]{1,10}\Z")
+
+# Valid yfinance period/interval values; frozensets give an O(1) probe and
+# avoid rebuilding a list on every call
+_VALID_PERIODS = frozenset(
+    {"1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"}
+)
+_VALID_INTERVALS = frozenset(
+    {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"}
+)
+
 
 def validate_ticker(ticker: str) -> str:
     """
@@ -23,15 +39,11 @@ def validate_ticker(ticker: str) -> str:
         raise InvalidTickerError("Ticker must be a non-empty string")
     
     ticker = ticker.strip().upper()
-    
-    if len(ticker) < 1 or len(ticker) > 10:
-        raise InvalidTickerError(f"Invalid ticker length: {ticker}")
-    
-    # Should be alphanumeric with possible dash, dot, or ampersand
-    allowed_chars = set("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-._&")
-    if not all(c in allowed_chars for c in ticker):
-        raise InvalidTickerError(f"Invalid characters in ticker: {ticker}")
-    
+
+    # 1-10 alphanumeric characters with possible dash, dot, or ampersand
+    if not _TICKER_RE.match(ticker):
+        raise InvalidTickerError(f"Invalid ticker: {ticker}")
+
     return ticker
 
 
@@ -73,11 +85,10 @@ def validate_period(period: str) -> str:
     Raises:
         ValidationError: If period is invalid
     """
-    valid_periods = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"]
-    
-    if period not in valid_periods:
-        raise ValidationError(f"Invalid period: {period}. Must be one of {valid_periods}")
-    
+    if period not in _VALID_PERIODS:
+        # Build the human-readable list only on the error path
+        raise ValidationError(f"Invalid period: {period}. Must be one of {sorted(_VALID_PERIODS)}")
+
     return period
 
 
@@ -94,11 +105,9 @@ def validate_interval(interval: str) -> str:
     Raises:
         ValidationError: If interval is invalid
     """
-    valid_intervals = ["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"]
-    
-    if interval not in valid_intervals:
-        raise ValidationError(f"Invalid interval: {interval}. Must be one of {valid_intervals}")
-    
+    if interval not in _VALID_INTERVALS:
+        raise ValidationError(f"Invalid interval: {interval}. Must be one of {sorted(_VALID_INTERVALS)}")
+
     return interval
 
 
@@ -125,6 +134,18 @@ def validate_positive_number(value: float, param_name: str = "value") -> float:
         raise ValidationError(f"{param_name} must be a number, got {type(value)}")
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_date(date_str: str) -> date:
+    """
+    Parse a stripped YYYY-MM-DD string to a date, caching repeat parses.
+
+    Validators see the same calendar boundaries over and over (range
+    checks parse both ends, and callers often re-validate identical
+    dates), so repeats become a dict lookup instead of a re-parse.
+    """
+    return date.fromisoformat(date_str)
+
+
 def validate_date(date_str: str, param_name: str = "date") -> str:
     """
     Validate date string format (YYYY-MM-DD).
@@ -147,8 +168,10 @@ def validate_date(date_str: str, param_name: str = "date") -> str:
             f"Invalid {param_name}: '{date_str}'. Use YYYY-MM-DD format."
         )
     try:
-        from datetime import datetime
-        datetime.strptime(date_str, "%Y-%m-%d")
+        # C-level ISO parser, several times faster than a strptime format
+        # state machine; the dash pre-check above keeps compact forms like
+        # "20240102" (also valid ISO 8601) rejected
+        _parse_iso_date(date_str)
     except ValueError:
         raise ValidationError(
             f"Invalid {param_name}: '{date_str}'. Use a valid YYYY-MM-DD date."
@@ -172,7 +195,9 @@ def validate_date_range(start_date: str, end_date: str) -> tuple:
     """
     start_date = validate_date(start_date, "start_date")
     end_date = validate_date(end_date, "end_date")
-    if start_date > end_date:
+    # The parses above are cached, so comparing the date objects costs
+    # two dict lookups rather than re-parsing or comparing strings
+    if _parse_iso_date(start_date) > _parse_iso_date(end_date):
         raise ValidationError(
             f"start_date ({start_date}) must be before or equal to end_date ({end_date})"
         )
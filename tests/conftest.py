@@ -2,8 +2,203 @@
 Pytest configuration and fixtures for InvestorMate tests.
 """
 
+import io
+from contextlib import redirect_stdout
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
 import pytest
 
+from investormate.data import cache, fetchers
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run tests marked 'network' that need live Yahoo access",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip network-marked tests unless --run-network was passed.
+
+    Default runs stay CPU-bound and rate-limit-proof; nightly or local
+    runs opt in to live-data coverage explicitly.
+    """
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+# ---------------------------------------------------------------------------
+# Deterministic yfinance fixtures, built once and shared across the session.
+# Tests that need specific payloads still patch yf.Ticker locally; everything
+# else gets these instead of real HTTP calls and rate-limit backoff.
+# ---------------------------------------------------------------------------
+
+_FIXTURE_DATES = pd.date_range("2024-01-01", periods=100, freq="D")
+
+_FIXTURE_HISTORY = pd.DataFrame(
+    {
+        "Open": np.linspace(148.0, 158.0, 100),
+        "High": np.linspace(150.0, 160.0, 100),
+        "Low": np.linspace(146.0, 156.0, 100),
+        "Close": np.linspace(149.0, 159.0, 100),
+        "Volume": np.full(100, 1_000_000),
+    },
+    index=_FIXTURE_DATES,
+)
+
+# yfinance statements: line items as rows, period-end dates as columns
+_FIXTURE_STATEMENT = pd.DataFrame(
+    {
+        pd.Timestamp("2024-09-30"): [95e9, 24e9, 350e9, 145e9, 62e9, 110e9],
+        pd.Timestamp("2024-06-30"): [94e9, 23e9, 345e9, 142e9, 61e9, 109e9],
+        pd.Timestamp("2024-03-31"): [92e9, 23e9, 340e9, 140e9, 60e9, 108e9],
+        pd.Timestamp("2023-12-31"): [90e9, 22e9, 338e9, 138e9, 59e9, 107e9],
+    },
+    index=["Total Revenue", "Net Income", "Total Assets",
+           "Current Liabilities", "Stockholders Equity", "Total Debt"],
+)
+
+_FIXTURE_EARNINGS_DATES = pd.DataFrame(
+    {"EPS Estimate": [1.5, 1.45, 1.4, 1.35, 1.3, 1.25, 1.2, 1.15]},
+    index=pd.DatetimeIndex([
+        "2025-07-31", "2025-04-30", "2025-01-30", "2024-10-31",
+        "2024-08-01", "2024-05-02", "2024-02-01", "2023-11-02",
+    ]),
+)
+
+_FIXTURE_INFO = {
+    "symbol": "AAPL",
+    "shortName": "Apple Inc.",
+    "longBusinessSummary": "Designs and sells consumer electronics.",
+    "sector": "Technology",
+    "industry": "Consumer Electronics",
+    "currentPrice": 150.0,
+    "previousClose": 149.0,
+    "marketCap": 2_500_000_000_000,
+    "volume": 50_000_000,
+    "trailingPE": 25.0,
+    "trailingEps": 6.0,
+    "forwardPE": 23.0,
+    "priceToBook": 40.0,
+    "pegRatio": 2.5,
+    "returnOnEquity": 0.45,
+    "returnOnAssets": 0.22,
+    "profitMargins": 0.25,
+    "operatingMargins": 0.30,
+    "grossMargins": 0.44,
+    "ebitda": 130e9,
+    "ebit": 120e9,
+    "effectiveTaxRate": 0.15,
+    "totalRevenue": 385e9,
+    "netIncomeToCommon": 95e9,
+    "totalAssets": 350e9,
+    "totalCurrentLiabilities": 145e9,
+    "totalStockholderEquity": 62e9,
+    "totalDebt": 110e9,
+    "totalCash": 60e9,
+    "currentRatio": 1.0,
+    "quickRatio": 0.9,
+    "debtToEquity": 150.0,
+    "interestExpense": 3.9e9,
+    "dividendYield": 0.005,
+    "payoutRatio": 0.15,
+    "earningsGrowth": 0.08,
+    "revenueGrowth": 0.05,
+    "freeCashflow": 100e9,
+    "operatingCashflow": 110e9,
+    "capitalExpenditure": -10e9,
+    "sharesOutstanding": 15_500_000_000,
+    "beta": 1.2,
+}
+
+# One mock per symbol, so repeated Stock("AAPL") constructions across the
+# suite share identical state
+_mock_tickers = {}
+
+
+def _fake_ticker(symbol, *args, **kwargs):
+    """Build (or reuse) a deterministic mock yf.Ticker for a symbol."""
+    if symbol not in _mock_tickers:
+        mock = MagicMock(name=f"Ticker({symbol})")
+        mock.ticker = symbol
+        mock.info = dict(_FIXTURE_INFO, symbol=symbol)
+        mock.balance_sheet = _FIXTURE_STATEMENT
+        mock.incomestmt = _FIXTURE_STATEMENT
+        mock.income_stmt = _FIXTURE_STATEMENT
+        mock.cash_flow = _FIXTURE_STATEMENT
+        mock.cashflow = _FIXTURE_STATEMENT
+        mock.earnings_dates = _FIXTURE_EARNINGS_DATES
+        mock.news = []
+        mock.sec_filings = None
+        for attr in ("earnings_estimate", "revenue_estimate", "earnings_history",
+                     "eps_trend", "eps_revisions", "growth_estimates"):
+            setattr(mock, attr, None)
+        mock.history.return_value = _FIXTURE_HISTORY
+        _mock_tickers[symbol] = mock
+    return _mock_tickers[symbol]
+
+
+@pytest.fixture(autouse=True, scope="session")
+def mock_yfinance():
+    """Replace yfinance endpoints with deterministic fixtures for the session.
+
+    Every unpatched Stock("AAPL") / EarningsCallTranscripts("AAPL") used to
+    hit Yahoo for real, so the suite spent nearly all its wall clock on
+    network latency and rate-limit backoff. Tests that patch yf.Ticker
+    themselves simply override this for their duration.
+    """
+    market = MagicMock(name="Market")
+    market.summary = {}
+    market._fetch_json.return_value = {}
+    with patch("yfinance.Ticker", side_effect=_fake_ticker), \
+         patch("yfinance.Market", return_value=market):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_ticker_cache():
+    """Clear the shared yf.Ticker cache so patched tickers don't leak across tests."""
+    fetchers._ticker.cache_clear()
+    fetchers._EMPTY_TICKERS.clear()
+    fetchers._empty_streaks.clear()
+    yield
+    fetchers._ticker.cache_clear()
+    fetchers._EMPTY_TICKERS.clear()
+    fetchers._empty_streaks.clear()
+
+
+@pytest.fixture(autouse=True)
+def disable_disk_cache():
+    """Keep the on-disk TTL cache out of test runs."""
+    cache.set_cache_enabled(False)
+    yield
+    cache.set_cache_enabled(True)
+
+
+@pytest.fixture(scope="session")
+def capture():
+    """In-process stdout capture for print-style functions.
+
+    Cheaper than capsys/capfd for tests that only need the output text:
+    everything stays in a StringIO, no file-descriptor duplication on
+    setup and teardown.
+    """
+    def _capture(fn, *args, **kwargs):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            fn(*args, **kwargs)
+        return buf.getvalue()
+    return _capture
+
 
 @pytest.fixture
 def sample_ticker():
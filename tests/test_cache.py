@@ -0,0 +1,96 @@
+"""Tests for the on-disk TTL cache."""
+
+import json
+
+import pytest
+
+from investormate.data import cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a fresh tmp dir and enable it for the test."""
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.set_cache_enabled(True)
+    yield tmp_path
+    cache.set_cache_enabled(False)
+
+
+def _rewind_entry(cache_dir, seconds):
+    """Age every cached entry by rewriting its fetched_at timestamp."""
+    for path in cache_dir.rglob("*.json"):
+        payload = json.loads(path.read_text())
+        payload["fetched_at"] -= seconds
+        path.write_text(json.dumps(payload))
+
+
+def _counting_fetcher(results):
+    """Build a cached fetcher that pops canned results and counts calls."""
+    calls = []
+
+    @cache.cached_json(ttl_days=1, namespace="test")
+    def fetch(ticker):
+        calls.append(ticker)
+        return results.pop(0)
+
+    return fetch, calls
+
+
+def test_miss_then_hit(cache_dir):
+    fetch, calls = _counting_fetcher([{"price": 1.0}, {"price": 2.0}])
+    assert fetch("AAPL") == {"price": 1.0}
+    # Second call is served from disk, not the function
+    assert fetch("AAPL") == {"price": 1.0}
+    assert calls == ["AAPL"]
+
+
+def test_expiry_refetches(cache_dir):
+    fetch, calls = _counting_fetcher([{"price": 1.0}, {"price": 2.0}])
+    assert fetch("AAPL") == {"price": 1.0}
+    _rewind_entry(cache_dir, 2 * 86400)
+    assert fetch("AAPL") == {"price": 2.0}
+    assert calls == ["AAPL", "AAPL"]
+
+
+def test_empty_result_expires_early(cache_dir):
+    fetch, calls = _counting_fetcher([{}, {"price": 1.0}])
+    assert fetch("AAPL") == {}
+    # Within the short negative TTL the empty result is still served
+    assert fetch("AAPL") == {}
+    assert calls == ["AAPL"]
+    # Past the negative TTL (but well inside ttl_days) it is refetched
+    _rewind_entry(cache_dir, cache._EMPTY_TTL_SECONDS + 1)
+    assert fetch("AAPL") == {"price": 1.0}
+    assert calls == ["AAPL", "AAPL"]
+
+
+def test_invalidate_removes_only_that_ticker(cache_dir):
+    fetch, calls = _counting_fetcher(
+        [{"t": "AAPL"}, {"t": "MSFT"}, {"t": "AAPL2"}]
+    )
+    fetch("AAPL")
+    fetch("MSFT")
+    assert cache.invalidate("AAPL") == 1
+    # AAPL refetches, MSFT is still served from disk
+    assert fetch("AAPL") == {"t": "AAPL2"}
+    assert fetch("MSFT") == {"t": "MSFT"}
+    assert calls == ["AAPL", "MSFT", "AAPL"]
+
+
+def test_invalidate_does_not_match_prefix_tickers(cache_dir):
+    fetch, calls = _counting_fetcher([{"t": "A"}, {"t": "A.B"}])
+    fetch("A")
+    fetch("A.B")
+    # "A" sanitizes to the prefix of "A.B"'s sanitized form ("A_B_...");
+    # only the exact ticker's entry may go
+    assert cache.invalidate("A") == 1
+    assert fetch("A.B") == {"t": "A.B"}
+    assert calls == ["A", "A.B"]
+
+
+def test_disabled_cache_bypasses_disk(cache_dir):
+    cache.set_cache_enabled(False)
+    fetch, calls = _counting_fetcher([{"price": 1.0}, {"price": 2.0}])
+    assert fetch("AAPL") == {"price": 1.0}
+    assert fetch("AAPL") == {"price": 2.0}
+    assert list(cache_dir.rglob("*.json")) == []
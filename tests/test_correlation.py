@@ -36,7 +36,7 @@ class TestCorrelation:
         assert corr.period == "6mo"
         assert corr.interval == "1wk"
     
-    @patch('investormate.analysis.correlation.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_fetch_price_data(self, mock_ticker):
         """Test fetching price data."""
         # Mock price data
@@ -67,7 +67,7 @@ class TestCorrelation:
         assert 'GOOGL' in prices.columns
         assert len(prices) == 10
     
-    @patch('investormate.analysis.correlation.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_fetch_price_data_failure(self, mock_ticker):
         """Test handling of data fetch failures."""
         # Mock empty data
@@ -78,7 +78,7 @@ class TestCorrelation:
         with pytest.raises(DataFetchError, match="Failed to fetch data for all tickers"):
             corr._fetch_price_data()
     
-    @patch('investormate.analysis.correlation.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_get_returns(self, mock_ticker):
         """Test calculation of daily returns."""
         dates = pd.date_range('2024-01-01', periods=10, freq='D')
@@ -96,7 +96,7 @@ class TestCorrelation:
         assert 'AAPL' in returns.columns
         assert 'GOOGL' in returns.columns
     
-    @patch('investormate.analysis.correlation.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_matrix_pearson(self, mock_ticker):
         """Test correlation matrix calculation with Pearson method."""
         dates = pd.date_range('2024-01-01', periods=100, freq='D')
@@ -137,7 +137,7 @@ class TestCorrelation:
         # Check correlation is high (we created correlated data)
         assert matrix.loc['AAPL', 'GOOGL'] > 0.8
     
-    @patch('investormate.analysis.correlation.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_matrix_spearman(self, mock_ticker):
         """Test correlation matrix with Spearman method."""
         dates = pd.date_range('2024-01-01', periods=50, freq='D')
@@ -160,7 +160,7 @@ class TestCorrelation:
         with pytest.raises(ValueError, match="Method must be one of"):
             corr.matrix(method='invalid')
     
-    @patch('investormate.analysis.correlation.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_find_pairs(self, mock_ticker):
         """Test finding correlated pairs."""
         dates = pd.date_range('2024-01-01', periods=100, freq='D')
@@ -207,7 +207,7 @@ class TestCorrelation:
         with pytest.raises(ValueError, match="Threshold must be between 0 and 1"):
             corr.find_pairs(threshold=-0.5)
     
-    @patch('investormate.analysis.correlation.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_find_diversification_candidates(self, mock_ticker):
         """Test finding diversification candidates."""
         dates = pd.date_range('2024-01-01', periods=100, freq='D')
@@ -299,7 +299,7 @@ class TestCorrelation:
                 max_correlation=0.3
             )
     
-    @patch('investormate.analysis.correlation.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_get_statistics(self, mock_ticker):
         """Test getting correlation statistics."""
         dates = pd.date_range('2024-01-01', periods=50, freq='D')
@@ -347,7 +347,7 @@ class TestCorrelation:
         assert "GOOGL" in repr_str
         assert "1y" in repr_str
     
-    @patch('investormate.analysis.correlation.yf.Ticker')
+    @patch('yfinance.Ticker')
     def test_caching(self, mock_ticker):
         """Test that price data is cached."""
         dates = pd.date_range('2024-01-01', periods=10, freq='D')
@@ -11,9 +11,9 @@ from investormate.data import EarningsCallTranscripts
 class TestEarningsCallTranscripts:
     """Test earnings call transcripts functionality."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def transcripts(self):
-        """Create an earnings transcripts instance."""
+        """Create an earnings transcripts instance (shared across the module)."""
         return EarningsCallTranscripts("AAPL")
     
     def test_initialization(self, transcripts):
@@ -40,12 +40,11 @@ class TestEarningsCallTranscripts:
         # yfinance doesn't provide transcripts, so should be None
         assert transcript is None
     
-    def test_print_pretty_table_handles_none(self, transcripts, capsys):
+    def test_print_pretty_table_handles_none(self, transcripts, capture):
         """Test that print_pretty_table handles missing transcripts gracefully."""
-        transcripts.print_pretty_table(2024, 4)
-        
-        captured = capsys.readouterr()
-        assert "not available" in captured.out.lower()
+        out = capture(transcripts.print_pretty_table, 2024, 4)
+
+        assert "not available" in out.lower()
     
     def test_search_transcript_empty_result(self, transcripts):
         """Test searching when transcript is not available."""
@@ -66,9 +65,9 @@ class TestEarningsCallTranscripts:
 class TestStockIntegration:
     """Test earnings transcripts integration with Stock class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def stock(self):
-        """Create a stock instance."""
+        """Create a stock instance (shared across the module)."""
         return Stock("AAPL")
     
     def test_stock_has_earnings_transcripts_property(self, stock):
@@ -89,12 +88,15 @@ class TestStockIntegration:
         
         assert transcripts1 is transcripts2  # Same object
     
-    def test_refresh_clears_transcripts_cache(self, stock):
+    def test_refresh_clears_transcripts_cache(self):
         """Test that refresh() clears transcripts cache."""
+        # Uses its own Stock since refresh() mutates state the shared
+        # module-scoped fixture should not pick up
+        stock = Stock("AAPL")
         transcripts1 = stock.earnings_transcripts
         stock.refresh()
         transcripts2 = stock.earnings_transcripts
-        
+
         assert transcripts1 is not transcripts2  # Different objects
 
 
@@ -3,10 +3,14 @@ Tests for data fetchers null safety (Phase 1.1 P0).
 Ensures fetchers handle None/empty yfinance responses without raising.
 """
 
+import threading
+import time
+
 import pandas as pd
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
+from investormate.data import fetchers
 from investormate.data.fetchers import (
     get_yfinance_data,
     get_yfinance_balance_sheet_data,
@@ -18,94 +22,122 @@ from investormate.data.fetchers import (
 )
 
 
+def make_ticker(**attrs):
+    """Build a yf.Ticker replacement whose instances carry the given attrs.
+
+    Dotted keys work too, e.g. make_ticker(**{"history.return_value": df}).
+    """
+    mock_ticker = MagicMock()
+    mock_ticker.configure_mock(**attrs)
+    return MagicMock(return_value=mock_ticker)
+
+
+# (fetcher, ticker attribute, attribute value, expected safe default).
+# "history" is a method on yf.Ticker, so the test wires it up via
+# history.return_value instead of a plain attribute
+_NULL_SAFETY_CASES = [
+    pytest.param(get_yfinance_data, "info", None, {},
+                 id="data-info-none"),
+    pytest.param(get_yfinance_data, "info", "not a dict", {},
+                 id="data-info-not-dict"),
+    pytest.param(get_yfinance_balance_sheet_data, "balance_sheet", None, {},
+                 id="balance-sheet-none"),
+    pytest.param(get_yfinance_balance_sheet_data, "balance_sheet", pd.DataFrame(), {},
+                 id="balance-sheet-empty"),
+    pytest.param(get_yfinance_income_statement_data, "incomestmt", pd.DataFrame(), {},
+                 id="income-statement-empty"),
+    pytest.param(get_yfinance_cash_flow_statement_data, "cash_flow", pd.DataFrame(), {},
+                 id="cash-flow-empty"),
+    pytest.param(get_yfinance_stock_history, "history", None, {},
+                 id="history-none"),
+    pytest.param(get_yfinance_stock_history, "history", pd.DataFrame(), {},
+                 id="history-empty"),
+    pytest.param(get_yfinance_stock_history, "history",
+                 pd.DataFrame({"A": [1], "B": [2]}), {},
+                 id="history-columns-missing"),
+    pytest.param(get_yfinance_ticker_news, "news", None, [],
+                 id="news-none"),
+]
+
+
 class TestFetcherNullSafety:
     """Test that fetchers return safe defaults for None/empty data."""
 
-    @patch("investormate.data.fetchers.yf.Ticker")
-    def test_get_yfinance_data_returns_empty_dict_when_info_is_none(self, mock_ticker_cls):
-        mock_ticker = MagicMock()
-        mock_ticker.info = None
-        mock_ticker_cls.return_value = mock_ticker
-        result = get_yfinance_data("INVALID")
-        assert result == {}
+    @pytest.mark.parametrize("fetcher,attr,value,expected", _NULL_SAFETY_CASES)
+    def test_fetcher_null_safety(self, fetcher, attr, value, expected, monkeypatch):
+        key = "history.return_value" if attr == "history" else attr
+        monkeypatch.setattr("yfinance.Ticker", make_ticker(**{key: value}))
+        result = fetcher("TICK")
+        assert result == expected
 
-    @patch("investormate.data.fetchers.yf.Ticker")
-    def test_get_yfinance_data_returns_empty_dict_when_info_not_dict(self, mock_ticker_cls):
-        mock_ticker = MagicMock()
-        mock_ticker.info = "not a dict"
-        mock_ticker_cls.return_value = mock_ticker
-        result = get_yfinance_data("TICK")
+    def test_get_yfinance_market_summary_us_returns_empty_dict_when_summary_none(self, monkeypatch):
+        mock_market = MagicMock()
+        mock_market.summary = None
+        monkeypatch.setattr("yfinance.Market", MagicMock(return_value=mock_market))
+        result = get_yfinance_market_summary_us()
         assert result == {}
 
-    @patch("investormate.data.fetchers.yf.Ticker")
-    def test_get_yfinance_balance_sheet_returns_empty_dict_when_df_none(self, mock_ticker_cls):
-        mock_ticker = MagicMock()
-        mock_ticker.balance_sheet = None
-        mock_ticker_cls.return_value = mock_ticker
-        result = get_yfinance_balance_sheet_data("TICK")
-        assert result == {}
 
-    @patch("investormate.data.fetchers.yf.Ticker")
-    def test_get_yfinance_balance_sheet_returns_empty_dict_when_df_empty(self, mock_ticker_cls):
-        mock_ticker = MagicMock()
-        mock_ticker.balance_sheet = pd.DataFrame()
-        mock_ticker_cls.return_value = mock_ticker
-        result = get_yfinance_balance_sheet_data("TICK")
-        assert result == {}
+class TestBatchFetch:
+    """Test the batched yf.Tickers info fetch."""
 
-    @patch("investormate.data.fetchers.yf.Ticker")
-    def test_get_yfinance_income_statement_returns_empty_dict_when_df_empty(self, mock_ticker_cls):
-        mock_ticker = MagicMock()
-        mock_ticker.incomestmt = pd.DataFrame()
-        mock_ticker_cls.return_value = mock_ticker
-        result = get_yfinance_income_statement_data("TICK")
-        assert result == {}
+    def test_get_yfinance_data_batch_accepts_lowercase(self, monkeypatch):
+        info = {"currentPrice": 10.0}
 
-    @patch("investormate.data.fetchers.yf.Ticker")
-    def test_get_yfinance_cash_flow_returns_empty_dict_when_df_empty(self, mock_ticker_cls):
-        mock_ticker = MagicMock()
-        mock_ticker.cash_flow = pd.DataFrame()
-        mock_ticker_cls.return_value = mock_ticker
-        result = get_yfinance_cash_flow_statement_data("TICK")
-        assert result == {}
+        def fake_tickers(symbols, session=None):
+            # Mirror yf.Tickers, which uppercases its dict keys
+            multi = MagicMock()
+            multi.tickers = {s.upper(): MagicMock(info=info) for s in symbols.split()}
+            return multi
 
-    @patch("investormate.data.fetchers.yf.Ticker")
-    def test_get_yfinance_stock_history_returns_empty_dict_when_df_none(self, mock_ticker_cls):
-        mock_ticker = MagicMock()
-        mock_ticker.history.return_value = None
-        mock_ticker_cls.return_value = mock_ticker
-        result = get_yfinance_stock_history("TICK")
-        assert result == {}
+        monkeypatch.setattr("yfinance.Tickers", fake_tickers)
+        result = fetchers.get_yfinance_data_batch(["aapl", "MSFT"])
+        assert result == {"aapl": info, "MSFT": info}
 
-    @patch("investormate.data.fetchers.yf.Ticker")
-    def test_get_yfinance_stock_history_returns_empty_dict_when_df_empty(self, mock_ticker_cls):
-        mock_ticker = MagicMock()
-        mock_ticker.history.return_value = pd.DataFrame()
-        mock_ticker_cls.return_value = mock_ticker
-        result = get_yfinance_stock_history("TICK")
-        assert result == {}
 
-    @patch("investormate.data.fetchers.yf.Ticker")
-    def test_get_yfinance_stock_history_returns_empty_dict_when_columns_missing(self, mock_ticker_cls):
-        mock_ticker = MagicMock()
-        # DataFrame with wrong columns
-        mock_ticker.history.return_value = pd.DataFrame({"A": [1], "B": [2]})
-        mock_ticker_cls.return_value = mock_ticker
-        result = get_yfinance_stock_history("TICK")
-        assert result == {}
+class TestFetchAll:
+    """Test the concurrent multi-endpoint fetch."""
 
-    @patch("investormate.data.fetchers.yf.Ticker")
-    def test_get_yfinance_ticker_news_returns_empty_list_when_news_none(self, mock_ticker_cls):
-        mock_ticker = MagicMock()
-        mock_ticker.news = None
-        mock_ticker_cls.return_value = mock_ticker
-        result = get_yfinance_ticker_news("TICK")
-        assert result == []
+    def test_timeout_returns_none_for_slow_endpoint(self, monkeypatch):
+        release = threading.Event()
 
-    @patch("investormate.data.fetchers.yf.Market")
-    def test_get_yfinance_market_summary_us_returns_empty_dict_when_summary_none(self, mock_market_cls):
-        mock_market = MagicMock()
-        mock_market.summary = None
-        mock_market_cls.return_value = mock_market
-        result = get_yfinance_market_summary_us()
-        assert result == {}
+        def slow(ticker_name):
+            release.wait(5)
+            return {"late": True}
+
+        monkeypatch.setitem(fetchers._ENDPOINTS, "info", slow)
+        monkeypatch.setitem(fetchers._ENDPOINTS, "news", lambda t: [{"title": "x"}])
+
+        start = time.monotonic()
+        with pytest.warns(UserWarning, match="timed out"):
+            result = fetchers.fetch_all("TICK", endpoints=["info", "news"], timeout=0.2)
+        elapsed = time.monotonic() - start
+        # Let the abandoned worker exit promptly so the session doesn't
+        # wait on it at interpreter shutdown
+        release.set()
+
+        assert elapsed < 2
+        assert result["info"] is None
+        assert result["news"] == [{"title": "x"}]
+
+
+class TestNegativeCache:
+    """Test the per-(endpoint, ticker) empty-response blacklist."""
+
+    def test_repeated_empty_responses_blacklist_that_endpoint(self, monkeypatch):
+        monkeypatch.setattr("yfinance.Ticker", make_ticker(info=None))
+        assert get_yfinance_data("DEAD") == {}
+        assert get_yfinance_data("DEAD") == {}
+        assert ("get_yfinance_data", "DEAD") in fetchers._EMPTY_TICKERS
+        assert get_yfinance_data("DEAD") == {}
+
+    def test_empty_endpoint_does_not_blacklist_other_endpoints(self, monkeypatch):
+        # An ETF-like ticker: no balance sheet, but info is perfectly valid
+        info = {"currentPrice": 100.0}
+        monkeypatch.setattr("yfinance.Ticker", make_ticker(
+            balance_sheet=pd.DataFrame(), info=info))
+        assert get_yfinance_balance_sheet_data("SPY") == {}
+        assert get_yfinance_balance_sheet_data("SPY") == {}
+        assert ("get_yfinance_balance_sheet_data", "SPY") in fetchers._EMPTY_TICKERS
+        # The blacklist is scoped to the empty endpoint only
+        assert get_yfinance_data("SPY") == info
@@ -16,6 +16,11 @@ def test_format_currency():
     assert format_currency(None) == "N/A"
 
 
+def test_format_currency_trillions():
+    """Trillions get their own suffix since the delegation to formatters."""
+    assert format_currency(2500000000000, "USD") == "$2.50T"
+
+
 def test_format_percentage():
     """Test percentage formatting."""
     assert format_percentage(0.15) == "15.00%"
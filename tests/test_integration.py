@@ -17,23 +17,28 @@ from investormate import (
 class TestCorrelationIntegration:
     """Integration tests for Correlation with other features."""
 
-    @patch("investormate.analysis.correlation.yf.Ticker")
-    def test_correlation_with_portfolio_universe(self, mock_ticker):
-        """Test correlation used for portfolio diversification."""
+    @pytest.fixture(scope="module")
+    def price_frames(self):
+        """Seeded random-walk price frames, built once for the module."""
         import pandas as pd
         import numpy as np
 
+        np.random.seed(0)
         dates = pd.date_range("2024-01-01", periods=50, freq="D")
         base = np.random.randn(50).cumsum()
-
-        def mock_ticker_factory(ticker):
-            m = Mock()
-            m.history.return_value = pd.DataFrame(
+        return {
+            ticker: pd.DataFrame(
                 {"Close": 100 + base + np.random.randn(50) * 0.1}, index=dates
             )
-            return m
+            for ticker in ["AAPL", "GOOGL", "MSFT", "GLD", "TLT"]
+        }
 
-        mock_ticker.side_effect = mock_ticker_factory
+    @patch("yfinance.Ticker")
+    def test_correlation_with_portfolio_universe(self, mock_ticker, price_frames):
+        """Test correlation used for portfolio diversification."""
+        mock_ticker.side_effect = lambda ticker: Mock(
+            history=Mock(return_value=price_frames[ticker])
+        )
 
         corr = Correlation(["AAPL", "GOOGL", "MSFT", "GLD", "TLT"], period="1mo")
         candidates = corr.find_diversification_candidates(
@@ -82,6 +87,23 @@ class TestBacktestIntegration:
         def on_data(self, data):
             pass
 
+    @pytest.fixture(scope="module")
+    def mock_hist(self):
+        """Flat 100-day OHLCV history, built once for the module.
+
+        One 2-D float64 fill instead of five scalar-broadcast columns.
+        """
+        import numpy as np
+        import pandas as pd
+
+        dates = pd.date_range("2023-01-01", periods=100, freq="D")
+        arr = np.empty((100, 5), dtype=np.float64)
+        arr[:] = [150, 155, 148, 152, 1_000_000]
+        return pd.DataFrame(
+            arr, columns=["Open", "High", "Low", "Close", "Volume"],
+            index=dates, copy=False,
+        )
+
     def test_backtest_imports(self):
         """Test all backtest components import correctly."""
         from investormate.backtest import Backtest, Strategy, BacktestEngine, BacktestResults
@@ -90,7 +112,7 @@ class TestBacktestIntegration:
         assert BacktestEngine is not None
         assert BacktestResults is not None
 
-    def test_backtest_creates_results(self):
+    def test_backtest_creates_results(self, mock_hist):
         """Test Backtest.run() returns BacktestResults."""
         bt = Backtest(
             strategy=self.DummyStrategy,
@@ -100,18 +122,6 @@ class TestBacktestIntegration:
             initial_capital=10000,
         )
         with patch("yfinance.Ticker") as mock_ticker:
-            import pandas as pd
-            dates = pd.date_range("2023-01-01", periods=100, freq="D")
-            mock_hist = pd.DataFrame(
-                {
-                    "Open": 150,
-                    "High": 155,
-                    "Low": 148,
-                    "Close": 152,
-                    "Volume": 1000000,
-                },
-                index=dates,
-            )
             mock_ticker.return_value.history.return_value = mock_hist
 
             results = bt.run()
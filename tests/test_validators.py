@@ -12,20 +12,21 @@ from investormate.utils.validators import (
 from investormate.utils.exceptions import InvalidTickerError, APIKeyError, ValidationError
 
 
-def test_validate_ticker_valid():
+@pytest.mark.parametrize("ticker,expected", [
+    ("AAPL", "AAPL"),
+    ("aapl", "AAPL"),
+    ("BRK-B", "BRK-B"),
+])
+def test_validate_ticker_valid(ticker, expected):
     """Test valid ticker validation."""
-    assert validate_ticker("AAPL") == "AAPL"
-    assert validate_ticker("aapl") == "AAPL"
-    assert validate_ticker("BRK-B") == "BRK-B"
+    assert validate_ticker(ticker) == expected
 
 
-def test_validate_ticker_invalid():
+@pytest.mark.parametrize("ticker", ["", "TOOLONGTICKER"])
+def test_validate_ticker_invalid(ticker):
     """Test invalid ticker validation."""
     with pytest.raises(InvalidTickerError):
-        validate_ticker("")
-    
-    with pytest.raises(InvalidTickerError):
-        validate_ticker("TOOLONGTICKER")
+        validate_ticker(ticker)
 
 
 def test_validate_api_key_valid():
@@ -34,19 +35,17 @@ def test_validate_api_key_valid():
     assert key == "sk-1234567890"
 
 
-def test_validate_api_key_invalid():
+@pytest.mark.parametrize("api_key", ["", "short"])
+def test_validate_api_key_invalid(api_key):
     """Test invalid API key."""
     with pytest.raises(APIKeyError):
-        validate_api_key("", "Test")
-    
-    with pytest.raises(APIKeyError):
-        validate_api_key("short", "Test")
+        validate_api_key(api_key, "Test")
 
 
 def test_validate_period():
     """Test period validation."""
     assert validate_period("1y") == "1y"
-    
+
     with pytest.raises(ValidationError):
         validate_period("invalid")
 
@@ -54,32 +53,41 @@ def test_validate_period():
 def test_validate_interval():
     """Test interval validation."""
     assert validate_interval("1d") == "1d"
-    
+
     with pytest.raises(ValidationError):
         validate_interval("invalid")
 
 
-def test_validate_date():
+@pytest.mark.parametrize("date_str,expected", [
+    ("2024-01-15", "2024-01-15"),
+    ("  2023-12-31  ", "2023-12-31"),
+])
+def test_validate_date_valid(date_str, expected):
     """Test date validation (YYYY-MM-DD)."""
-    assert validate_date("2024-01-15") == "2024-01-15"
-    assert validate_date("  2023-12-31  ") == "2023-12-31"
-    
-    with pytest.raises(ValidationError):
-        validate_date("")
-    with pytest.raises(ValidationError):
-        validate_date("01-15-2024")
-    with pytest.raises(ValidationError):
-        validate_date("2024-13-01")
+    assert validate_date(date_str) == expected
+
+
+@pytest.mark.parametrize("date_str", ["", "01-15-2024", "2024-13-01", "not-a-date"])
+def test_validate_date_invalid(date_str):
+    """Test rejection of malformed or impossible dates."""
     with pytest.raises(ValidationError):
-        validate_date("not-a-date")
+        validate_date(date_str)
 
 
-def test_validate_date_range():
+@pytest.mark.parametrize("start,end", [
+    ("2023-01-01", "2023-12-31"),
+    ("2024-06-15", "2024-06-15"),
+])
+def test_validate_date_range_valid(start, end):
     """Test date range validation."""
-    assert validate_date_range("2023-01-01", "2023-12-31") == ("2023-01-01", "2023-12-31")
-    assert validate_date_range("2024-06-15", "2024-06-15") == ("2024-06-15", "2024-06-15")
-    
-    with pytest.raises(ValidationError):
-        validate_date_range("2023-12-31", "2023-01-01")
+    assert validate_date_range(start, end) == (start, end)
+
+
+@pytest.mark.parametrize("start,end", [
+    ("2023-12-31", "2023-01-01"),
+    ("invalid", "2023-12-31"),
+])
+def test_validate_date_range_invalid(start, end):
+    """Test rejection of inverted or malformed date ranges."""
     with pytest.raises(ValidationError):
-        validate_date_range("invalid", "2023-12-31")
+        validate_date_range(start, end)
@@ -6,10 +6,17 @@ from investormate import Stock
 from investormate.analysis.valuation import Valuation
 
 
+class _RatiosStub:
+    """Bare wacc holder; Valuation only ever reads .wacc off ratios."""
+
+    __slots__ = ('wacc',)
+
+    def __init__(self, wacc):
+        self.wacc = wacc
+
+
 def _make_ratios_mock(wacc=0.10):
-    m = pytest.importorskip("unittest.mock").MagicMock()
-    m.wacc = wacc
-    return m
+    return _RatiosStub(wacc)
 
 
 class TestValuationDCF:
@@ -71,15 +78,20 @@ class TestValuationComps:
         assert result["peer_multiples"] == {}
         assert "message" in result
 
-    @patch("investormate.analysis.valuation.get_yfinance_data")
-    def test_comps_with_peers_returns_structure(self, mock_get):
+    def test_comps_with_peers_returns_structure(self, monkeypatch):
         """Comps with peers returns median and implied values structure."""
-        mock_get.return_value = {
+        peer_info = {
             "trailingPE": 25.0,
             "enterpriseToEbitda": 15.0,
             "priceToSalesTrailing12Months": 5.0,
             "currentPrice": 150.0,
         }
+        # A plain function via monkeypatch is cheaper than a MagicMock
+        # behind @patch, and this test never inspects call records
+        monkeypatch.setattr(
+            "investormate.analysis.valuation.get_yfinance_data",
+            lambda *args, **kwargs: peer_info,
+        )
         info = {
             "trailingEps": 6.0,
             "ebitda": 10e9,
@@ -153,20 +165,25 @@ class TestValuationSensitivity:
         assert "max_value" in result
 
 
+@pytest.fixture(scope="module")
+def aapl_stock():
+    """One Stock("AAPL") shared by the integration tests; construction
+    triggers ticker validation and fetcher setup, so build it once."""
+    return Stock("AAPL")
+
+
 class TestStockValuationIntegration:
     """Test Stock.valuation property."""
 
-    def test_stock_has_valuation_property(self):
+    def test_stock_has_valuation_property(self, aapl_stock):
         """Stock has valuation property returning Valuation instance."""
-        stock = Stock("AAPL")
-        v = stock.valuation
+        v = aapl_stock.valuation
         assert isinstance(v, Valuation)
         assert v.ticker == "AAPL"
 
-    def test_stock_valuation_dcf_callable(self):
+    def test_stock_valuation_dcf_callable(self, aapl_stock):
         """Stock.valuation.dcf() is callable and returns dict."""
-        stock = Stock("AAPL")
-        result = stock.valuation.dcf(growth_rate=0.05)
+        result = aapl_stock.valuation.dcf(growth_rate=0.05)
         assert isinstance(result, dict)
         assert "fair_value_per_share" in result
         assert "assumptions" in result